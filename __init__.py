@@ -22,38 +22,40 @@ bl_info = {
 }
 
 import bpy
-import os
+import logging
+from functools import partial
 from pathlib import Path
 from bpy.types import WorkSpaceTool
 
-# Import operators with error handling
-try:
-    from .operators.crop_operators import (
-        EASYCROP_OT_crop, 
-        EASYCROP_OT_select_and_crop, 
-        EASYCROP_OT_activate_tool
-    )
-    from .operators.crop_core import (
-        is_strip_visible_at_frame,
-        get_crop_state,
-        set_crop_active,
-        clear_crop_state
-    )
-    operators_imported = True
-except ImportError as e:
-    operators_imported = False
+# Operators and gizmos are imported by register() rather than at addon
+# import, so enabling the addon only runs this module
+crop_operators = None
+crop_core = None
+gizmos = None
+operators_imported = False
+gizmos_imported = False
 
-# Import gizmos with error handling
-try:
-    from .gizmos import (
-        EASYCROP_GT_crop_handle,
-        EASYCROP_GGT_crop_handles,
-        register_crop_handles_gizmo,
-        unregister_crop_handles_gizmo
-    )
-    gizmos_imported = True
-except ImportError as e:
-    gizmos_imported = False
+
+def _import_submodules():
+    """Import operators and gizmos with error handling - called right before registration"""
+    global crop_operators, crop_core, gizmos, operators_imported, gizmos_imported
+    if not operators_imported:
+        try:
+            from .operators import crop_operators, crop_core
+            operators_imported = True
+        except ImportError:
+            return False
+    if not gizmos_imported:
+        try:
+            from . import gizmos
+            gizmos_imported = True
+        except ImportError:
+            gizmos_imported = False
+    return True
+
+
+# Tool icon path - use pathlib for cross-platform compatibility (Blender 4.4+ extensions)
+_ICON_PATH = str(Path(__file__).parent / "icons" / "crop")
 
 
 class EASYCROP_OT_clear_crop(bpy.types.Operator):
@@ -69,22 +71,22 @@ class EASYCROP_OT_clear_crop(bpy.types.Operator):
             return False
         
         # Check if any selected strips have crop capability
-        for strip in context.selected_sequences:
-            if hasattr(strip, 'crop'):
-                return True
-        return False
+        return any(hasattr(strip, 'crop') for strip in context.selected_sequences)
     
     def execute(self, context):
         cleared_count = 0
         
         for strip in context.selected_sequences:
             if hasattr(strip, 'crop') and strip.crop:
-                # Reset all crop values to 0
-                strip.crop.min_x = 0
-                strip.crop.max_x = 0
-                strip.crop.min_y = 0
-                strip.crop.max_y = 0
-                cleared_count += 1
+                # Skip strips that are already uncropped to avoid needless updates
+                crop = strip.crop
+                if crop.min_x or crop.max_x or crop.min_y or crop.max_y:
+                    # Reset all crop values to 0
+                    crop.min_x = 0
+                    crop.max_x = 0
+                    crop.min_y = 0
+                    crop.max_y = 0
+                    cleared_count += 1
         
         if cleared_count > 0:
             self.report({'INFO'}, f"Cleared crop from {cleared_count} strip(s)")
@@ -101,8 +103,7 @@ class EASYCROP_TOOL_crop_handles(WorkSpaceTool):
     bl_idname = "sequencer.crop_handles_tool"
     bl_label = "Crop"
     bl_description = "Crop strips using individual handle gizmos"
-    # Use pathlib for cross-platform compatibility (Blender 4.4+ extensions)
-    bl_icon = str(Path(__file__).parent / "icons" / "crop")
+    bl_icon = _ICON_PATH
     bl_widget = "EASYCROP_GGT_crop_handles"
     
     # Keymap is handled by gizmos - no tool-level keymap needed
@@ -110,6 +111,13 @@ class EASYCROP_TOOL_crop_handles(WorkSpaceTool):
     
     @staticmethod  
     def draw_settings(context, layout, tool):
+        # Skip the work when the tool settings region is collapsed or hidden
+        region = context.region
+        if region is None or region.height < 2:
+            return
+        if region.type == 'TOOL_HEADER' and not getattr(context.space_data, 'show_region_tool_header', True):
+            return
+        
         # Handles tool status display
         seq_editor = context.scene.sequence_editor
         if not seq_editor:
@@ -117,15 +125,14 @@ class EASYCROP_TOOL_crop_handles(WorkSpaceTool):
             return
             
         active_strip = seq_editor.active_strip
-        current_frame = context.scene.frame_current
         
-        # Show current state
-        crop_state = get_crop_state()
-        if crop_state['active']:
+        # Show current state - each input is read once, and only when its
+        # branch needs it
+        if crop_core.get_crop_state()['active']:
             layout.label(text="Modal crop mode active", icon='INFO')
             layout.label(text="(Handles tool disabled)")
         elif active_strip and hasattr(active_strip, 'crop'):
-            if is_strip_visible_at_frame(active_strip, current_frame):
+            if crop_core.is_strip_visible_at_frame(active_strip, context.scene.frame_current):
                 layout.label(text=f"Ready: {active_strip.name}")
                 layout.label(text="Drag handles to crop directly")
                 layout.label(text="Click center to start modal mode")
@@ -136,56 +143,69 @@ class EASYCROP_TOOL_crop_handles(WorkSpaceTool):
 
 
 # Menu functions
-def menu_func_strip_transform(self, context):
-    """Add Easy Crop to Strip > Transform menu"""
-    if context.space_data.view_type in {'PREVIEW', 'SEQUENCER_PREVIEW'}:
-        self.layout.operator_context = 'INVOKE_REGION_PREVIEW'
-        self.layout.operator("sequencer.crop", text="Crop")
+# Preview view types that show the crop menu entries
+_PREVIEW_VIEWS = frozenset({'PREVIEW', 'SEQUENCER_PREVIEW'})
+
+
+def _menu(self, context, op, text, invoke=False):
+    """Add a crop menu entry when the editor shows the preview"""
+    if context.space_data.view_type in _PREVIEW_VIEWS:
+        if invoke:
+            self.layout.operator_context = 'INVOKE_REGION_PREVIEW'
+        self.layout.operator(op, text=text)
 
 
-def menu_func_image_transform(self, context):
-    """Add Easy Crop to Image > Transform menu"""
-    if context.space_data.view_type in {'PREVIEW', 'SEQUENCER_PREVIEW'}:
-        self.layout.operator_context = 'INVOKE_REGION_PREVIEW'
-        self.layout.operator("sequencer.crop", text="Crop")
+# Add Easy Crop to Strip > Transform and Image > Transform menus
+menu_func_strip_transform = partial(_menu, op="sequencer.crop", text="Crop", invoke=True)
+menu_func_image_transform = partial(_menu, op="sequencer.crop", text="Crop", invoke=True)
 
+# Add Clear Crop to Image > Clear menu
+menu_func_image_clear = partial(_menu, op="sequencer.clear_crop", text="Crop")
 
-def menu_func_image_clear(self, context):
-    """Add Clear Crop to Image > Clear menu"""
-    if context.space_data.view_type in {'PREVIEW', 'SEQUENCER_PREVIEW'}:
-        self.layout.operator("sequencer.clear_crop", text="Crop")
 
+# Registration - filled in by register() once the operators are imported
+classes = []
 
-# Registration
-classes = [
-    EASYCROP_OT_crop,
-    EASYCROP_OT_select_and_crop,
-    EASYCROP_OT_activate_tool,
-    EASYCROP_OT_clear_crop,
-]
+# Keymap items added by register(), grouped by their keymap
+addon_keymaps = {}
 
-addon_keymaps = []
+# Preview region keymap - try both old and new keymap names for compatibility
+_KEYMAP_NAME = "Preview" if bpy.app.version >= (4, 5, 0) else "SequencerPreview"
+
+# (operator, key, modifiers) for each addon keymap item
+_KEYMAP_ITEMS = (
+    # Crop operator - C key (modal for quick access, returns to previous tool)
+    ("sequencer.crop", 'C', {}),
+    # Clear crop operator - Alt+C key
+    ("sequencer.clear_crop", 'C', {'alt': True}),
+)
 
 
 def register():
     """Register the addon"""
-    if not operators_imported:
+    if not _import_submodules():
         return
     
+    classes[:] = [
+        crop_operators.EASYCROP_OT_crop,
+        crop_operators.EASYCROP_OT_select_and_crop,
+        crop_operators.EASYCROP_OT_activate_tool,
+        EASYCROP_OT_clear_crop,
+    ]
+    
     # Register classes
     for cls in classes:
         if cls is not None:
             try:
                 bpy.utils.register_class(cls)
-            except Exception as e:
+            except Exception:
                 pass
     
     # Register gizmos
     if gizmos_imported:
         try:
-            register_crop_handles_gizmo()
-        except Exception as e:
-            pass
+            gizmos.register_crop_handles_gizmo()
+        except Exception:
             pass
     
     
@@ -193,26 +213,19 @@ def register():
     wm = bpy.context.window_manager
     kc = wm.keyconfigs.addon
     if kc:
-        # Preview region keymaps - try both old and new keymap names for compatibility
-        keymap_name = "Preview" if bpy.app.version >= (4, 5, 0) else "SequencerPreview"
-        km = kc.keymaps.new(name=keymap_name, space_type="SEQUENCE_EDITOR", region_type="WINDOW")
-
-        # Crop operator - C key (modal for quick access, returns to previous tool)
-        kmi = km.keymap_items.new("sequencer.crop", 'C', 'PRESS')
-        addon_keymaps.append((km, kmi))
-
-        # Clear crop operator - Alt+C key
-        kmi_clear = km.keymap_items.new("sequencer.clear_crop", 'C', 'PRESS', alt=True)
-        addon_keymaps.append((km, kmi_clear))
+        km = kc.keymaps.new(name=_KEYMAP_NAME, space_type="SEQUENCE_EDITOR", region_type="WINDOW")
+        items = addon_keymaps.setdefault(km, [])
+        new = km.keymap_items.new
+        for op, key, mods in _KEYMAP_ITEMS:
+            items.append(new(op, key, 'PRESS', **mods))
     
     # Register the tools - only the gizmo handles tool
     try:
         bpy.utils.register_tool(EASYCROP_TOOL_crop_handles, after={"builtin.transform"}, separator=False)
-    except Exception as e:
-        pass
+    except Exception:
         try:
             bpy.utils.register_tool(EASYCROP_TOOL_crop_handles)
-        except Exception as e2:
+        except Exception:
             pass
     
     # Add menu items
@@ -220,7 +233,7 @@ def register():
         bpy.types.SEQUENCER_MT_strip_transform.append(menu_func_strip_transform)
         bpy.types.SEQUENCER_MT_image_transform.append(menu_func_image_transform)
         bpy.types.SEQUENCER_MT_image_clear.append(menu_func_image_clear)
-    except Exception as e:
+    except Exception:
         pass
 
 
@@ -228,27 +241,31 @@ def unregister():
     """Unregister the addon"""
     # Force cleanup of any active crop mode
     try:
-        clear_crop_state()
+        crop_core.clear_crop_state()
     except:
         pass
     
-    # Force restore gizmos in case they were disabled
-    try:
-        for area in bpy.context.screen.areas:
-            if area.type == 'SEQUENCE_EDITOR':
-                for space in area.spaces:
-                    if space.type == 'SEQUENCE_EDITOR' and hasattr(space, 'show_gizmo'):
-                        space.show_gizmo = True
-    except:
-        pass
+    # Force restore gizmos in spaces where they were disabled
+    disabled_spaces = crop_core.get_gizmo_disabled_spaces() if crop_core else None
+    if disabled_spaces:
+        try:
+            # Check every space in the area - the hidden one may no longer be active
+            for window in bpy.context.window_manager.windows:
+                for area in window.screen.areas:
+                    for space in area.spaces:
+                        if space.type == 'SEQUENCE_EDITOR' and space.as_pointer() in disabled_spaces:
+                            space.show_gizmo = True
+        except Exception:
+            logging.getLogger(__name__).debug("Could not restore sequencer gizmos", exc_info=True)
+        finally:
+            disabled_spaces.clear()
     
     
     # Unregister gizmos
     if gizmos_imported:
         try:
-            unregister_crop_handles_gizmo()
-        except Exception as e:
-            pass
+            gizmos.unregister_crop_handles_gizmo()
+        except Exception:
             pass
     
     # Remove menu items
@@ -267,15 +284,16 @@ def unregister():
     
     # Clean up draw handlers
     try:
-        from .operators.crop_core import get_draw_handle
-        if get_draw_handle() is not None:
-            bpy.types.SpaceSequenceEditor.draw_handler_remove(get_draw_handle(), 'PREVIEW')
+        if crop_core.get_draw_handle() is not None:
+            bpy.types.SpaceSequenceEditor.draw_handler_remove(crop_core.get_draw_handle(), 'PREVIEW')
     except:
         pass
     
     # Remove keymaps
-    for km, kmi in addon_keymaps:
-        km.keymap_items.remove(kmi)
+    for km, items in addon_keymaps.items():
+        remove = km.keymap_items.remove
+        for kmi in items:
+            remove(kmi)
     addon_keymaps.clear()
     
     # Unregister classes
@@ -7,14 +7,55 @@ Based on the modal operator but using gizmos for better integration.
 
 import bpy
 import math
+from bpy.app.handlers import persistent
 import gpu
 from gpu_extras.batch import batch_for_shader
 from bpy.types import Gizmo, GizmoGroup
-from mathutils import Vector, Matrix
+from mathutils import Matrix
 
 from ..operators.crop_core import (
     get_crop_state, is_strip_visible_at_frame, 
-    get_strip_geometry_with_flip_support
+    get_strip_geometry_with_flip_support, get_strip_accessors, get_strip_size,
+    get_view_mapping, map_points_to_region,
+    track_gizmo_disabled_space, untrack_gizmo_disabled_space,
+    apply_crop_sides, CORNER_CROP_SIDES, EDGE_CROP_SIDES,
+    CORNER_FLIP_REMAP, EDGE_FLIP_REMAP
+)
+from ..operators.crop_drawing import (
+    get_builtin_shader, get_square_batch, get_symbol_batch, SQUARE_OFFSETS, SQUARE_INDICES
+)
+
+
+def _build_handle_squares(centers, half_size, cos_a, sin_a):
+    """Build TRIS vertices and indices for rotated handle squares at the given centers"""
+    # Rotate the square once - every handle shares the same offsets
+    offsets = [
+        ((x * cos_a - y * sin_a) * half_size, (x * sin_a + y * cos_a) * half_size)
+        for x, y in SQUARE_OFFSETS
+    ]
+    vertices = [(cx + dx, cy + dy) for cx, cy in centers for dx, dy in offsets]
+    indices = [
+        (base + a, base + b, base + c)
+        for base in range(0, len(vertices), 4)
+        for a, b, c in SQUARE_INDICES
+    ]
+    return vertices, indices
+
+
+# Per-vertex colors of the drag-time squares, one list per dragged handle
+# (corners 0-3, edges 4-7): orange for the active handle, white for the rest
+_DRAG_ACTIVE_COLOR = (1.0, 0.5, 0.0, 1.0)
+_DRAG_NORMAL_COLOR = (1.0, 1.0, 1.0, 0.8)
+_DRAG_HANDLE_COLORS = tuple(
+    [_DRAG_ACTIVE_COLOR if i == active else _DRAG_NORMAL_COLOR for i in range(8) for _ in range(4)]
+    for active in range(8)
+)
+
+# (handle_type, handle_index, select_id) for every handle in the group
+_HANDLE_SPEC = (
+    [("corner", i, i) for i in range(4)]
+    + [("edge", i, i + 4) for i in range(4)]
+    + [("center", 0, 8)]
 )
 
 
@@ -53,45 +94,32 @@ class EASYCROP_GT_crop_handle(Gizmo):
         # Set gizmo to be interactive
         self.select_id = 0  # Will be overridden in group setup
         
+        # Squared hit-test radius for test_select - generous 25px threshold
+        self._threshold_sq = 25 * 25
+        
+        # Drag-time handle squares batch, symbol position and the crop and
+        # view they were built for - reset when a drag starts
+        self._drag_batch = None
+        self._drag_symbol_position = None
+        self._drag_draw_key = None
+        
         # Note: handle_type and handle_index are set after creation in group setup
     
-    def draw_prepare(self, context):
-        """Prepare for drawing - ensure gizmo is visible"""
-        self.hide = False  # Force visibility
-        self.alpha = 0.8 if not self.is_highlight else 1.0
-    
     def draw(self, context):
         """Draw the handle gizmo using built-in methods"""
-        
-        # Ensure gizmo is not hidden
-        self.hide = False
-        
-        # Set colors based on state
+        # Visibility and alpha are kept by the group's refresh(), and the
+        # highlight color is picked here without writing it back to the gizmo
         if self.is_highlight:
-            self.color = self.color_highlight
-            self.alpha = self.alpha_highlight
+            color = (*self.color_highlight, self.alpha_highlight)
         else:
-            self.color = (1.0, 1.0, 1.0)
-            self.alpha = 0.8
+            color = (*self.color, self.alpha)
         
-        # Use custom GPU drawing with proper highlight colors
-        try:
-            # Use the color set by the highlight system
-            if self.is_highlight:
-                color = (*self.color_highlight, self.alpha_highlight)
-            else:
-                color = (*self.color, self.alpha)
-            
-            if self.handle_type == "center":
-                # Center handle - use custom crop symbol drawing
-                self._draw_crop_symbol(color)
-            else:
-                # Corner and edge handles - use custom square drawing with highlight color
-                self._draw_handle_square(color, context)
-                    
-                    
-        except Exception as e:
-            pass
+        if self.handle_type == "center":
+            # Center handle - use custom crop symbol drawing
+            self._draw_crop_symbol(color)
+        else:
+            # Corner and edge handles - use custom square drawing with highlight color
+            self._draw_handle_square(color, context)
     
     def draw_select(self, context, select_id):
         """Draw during selection/modal operations - keeps handles visible"""
@@ -108,152 +136,65 @@ class EASYCROP_GT_crop_handle(Gizmo):
             self._draw_crop_symbol(color)
         else:
             # Handle using ONLY square drawing for proper appearance
-            try:
-                # Draw square handles (no circles)
-                if self.is_highlight or during_modal:
-                    square_color = (1.0, 0.5, 0.0, 1.0)  # Orange when highlighted or during modal
-                else:
-                    square_color = (1.0, 1.0, 1.0, 0.7)  # White normally
-                
-                self._draw_handle_square(square_color, context)
-                
-            except Exception as e:
-                # Fallback
-                color = (1.0, 1.0, 1.0, 0.7)
-                self._draw_handle_square(color, context)
+            if self.is_highlight or during_modal:
+                square_color = (1.0, 0.5, 0.0, 1.0)  # Orange when highlighted or during modal
+            else:
+                square_color = (1.0, 1.0, 1.0, 0.7)  # White normally
+            
+            self._draw_handle_square(square_color, context)
     
     
-    def _draw_crop_symbol(self, color):
-        """Draw the crop symbol (for center handle) - match modal operator exactly"""
-        
-        try:
-            center_pos = self.matrix_basis.translation
-            center_x = center_pos.x
-            center_y = center_pos.y
-            
-            # Symbol dimensions - match modal operator exactly
-            outer_size = 8
-            inner_size = 5
-            
-            line_shader = gpu.shader.from_builtin('UNIFORM_COLOR')
-            gpu.state.line_width_set(1.5)  # Match modal operator exactly
-            line_shader.bind()
-            line_shader.uniform_float("color", color)
-            
-            # Corner brackets - match modal operator exactly
-            # Top-left L-shape
-            tl_vertical = [
-                (center_x - outer_size, center_y + 1),
-                (center_x - outer_size, center_y + outer_size)
-            ]
-            tl_horizontal = [
-                (center_x - outer_size, center_y + outer_size),
-                (center_x - 1, center_y + outer_size)
-            ]
-            
-            # Bottom-right L-shape
-            br_horizontal = [
-                (center_x + 1, center_y - outer_size),
-                (center_x + outer_size, center_y - outer_size)
-            ]
-            br_vertical = [
-                (center_x + outer_size, center_y - outer_size),
-                (center_x + outer_size, center_y - 1)
-            ]
-            
-            # Inner viewing rectangle
-            inner_rect_lines = [
-                [(center_x - inner_size, center_y - inner_size), 
-                 (center_x + inner_size, center_y - inner_size)],
-                [(center_x + inner_size, center_y - inner_size),
-                 (center_x + inner_size, center_y + inner_size)],
-                [(center_x + inner_size, center_y + inner_size),
-                 (center_x - inner_size, center_y + inner_size)],
-                [(center_x - inner_size, center_y + inner_size),
-                 (center_x - inner_size, center_y - inner_size)]
-            ]
-            
-            # Draw all elements
-            for line_verts in [tl_vertical, tl_horizontal, br_horizontal, br_vertical]:
-                batch = batch_for_shader(line_shader, 'LINES', {"pos": line_verts})
-                batch.draw(line_shader)
-            
-            for line_verts in inner_rect_lines:
-                batch = batch_for_shader(line_shader, 'LINES', {"pos": line_verts})
-                batch.draw(line_shader)
-            
-            gpu.state.line_width_set(1.0)
-            
-        except Exception as e:
-            pass
+    def _draw_crop_symbol(self, color, position=None):
+        """Draw the crop symbol at the given screen position, or at this handle - match modal operator exactly"""
+        if position is None:
+            # Translation column of the handle placement from refresh()
+            matrix = self.matrix_basis
+            position = (matrix[0][3], matrix[1][3])
+        
+        line_shader = get_builtin_shader('UNIFORM_COLOR')
+        batch = get_symbol_batch(line_shader)
+        
+        gpu.state.line_width_set(1.5)  # Match modal operator exactly
+        line_shader.bind()
+        line_shader.uniform_float("color", color)
+        
+        # Draw the cached symbol translated to the position
+        gpu.matrix.push()
+        gpu.matrix.translate(position)
+        batch.draw(line_shader)
+        gpu.matrix.pop()
+        
+        gpu.state.line_width_set(1.0)
     
     def _draw_handle_square(self, color, context):
         """Draw a handle square (for corner and edge handles) with rotation - match modal operator exactly"""
         
-        try:
-            center_pos = self.matrix_basis.translation
-            center_x = center_pos.x
-            center_y = center_pos.y
-            
-            # Handle size - match modal operator exactly
-            size = 6
-            
-            # Use the same rotation that was calculated in refresh() - stored in the matrix
-            # Extract rotation from the gizmo's matrix_basis which already has proper flip compensation
-            rotation_matrix = self.matrix_basis.to_3x3()
-            rotation_angle = rotation_matrix.to_euler().z
-            
-            # Apply rotation to square vertices like modal operator
-            if abs(rotation_angle) > 0.01:  # If there's meaningful rotation
-                cos_a = math.cos(rotation_angle)
-                sin_a = math.sin(rotation_angle)
-                
-                # Define square corners relative to center
-                corners_rel = [
-                    (-size, -size), (size, -size), (size, size), (-size, size)
-                ]
-                
-                # Rotate and translate
-                vertices = []
-                for x_rel, y_rel in corners_rel:
-                    x = x_rel * cos_a - y_rel * sin_a + center_x
-                    y = x_rel * sin_a + y_rel * cos_a + center_y
-                    vertices.append((x, y))
-                
-                # Reorder vertices like modal operator for proper triangle winding
-                vertices = [vertices[0], vertices[1], vertices[3], vertices[2]]
-            else:
-                # No rotation - regular square
-                vertices = [
-                    (center_x - size, center_y - size),
-                    (center_x + size, center_y - size),
-                    (center_x - size, center_y + size),
-                    (center_x + size, center_y + size)
-                ]
-            
-            indices = ((0, 1, 2), (2, 1, 3))
-            
-            shader = gpu.shader.from_builtin('UNIFORM_COLOR')
-            batch = batch_for_shader(shader, 'TRIS', {"pos": vertices}, indices=indices)
-            shader.bind()
-            shader.uniform_float("color", color)
-            batch.draw(shader)
-            
-        except Exception as e:
-            pass
-    
-    # Removed _get_strip_rotation method - now getting rotation directly like modal operator
+        # Handle size - match modal operator exactly
+        size = 6
+        
+        shader = get_builtin_shader('UNIFORM_COLOR')
+        batch = get_square_batch(shader)
+        shader.bind()
+        shader.uniform_float("color", color)
+        
+        # matrix_basis already holds the position and the flip-compensated
+        # rotation calculated in refresh(), so just scale the unit square
+        gpu.matrix.push()
+        gpu.matrix.multiply_matrix(self.matrix_basis)
+        gpu.matrix.scale((size, size))
+        batch.draw(shader)
+        gpu.matrix.pop()
     
     def test_select(self, context, event):
         """Test if point is over this gizmo"""
         # Use a simple distance check - but only return select_id if we're actually close
-        gizmo_pos = self.matrix_basis.translation
+        matrix = self.matrix_basis
         mouse_pos = event  # event is (x, y) tuple
         
-        distance = ((gizmo_pos.x - mouse_pos[0])**2 + (gizmo_pos.y - mouse_pos[1])**2)**0.5
-        threshold = 25  # Generous threshold
+        dx = matrix[0][3] - mouse_pos[0]
+        dy = matrix[1][3] - mouse_pos[1]
         
-        if distance <= threshold:
+        if dx * dx + dy * dy <= self._threshold_sq:
             return self.select_id
         else:
             return -1
@@ -270,8 +211,7 @@ class EASYCROP_GT_crop_handle(Gizmo):
             try:
                 bpy.ops.sequencer.crop('INVOKE_DEFAULT')
                 return {'FINISHED'}
-            except Exception as e:
-                pass
+            except Exception:
                 return {'CANCELLED'}
         else:
             # Start crop handle drag - store initial values like modal operator
@@ -282,11 +222,18 @@ class EASYCROP_GT_crop_handle(Gizmo):
             # Mark drag as active to prevent gizmo repositioning
             EASYCROP_GGT_crop_handles._drag_active = True
             
+            # Preview area to redraw while dragging - found once instead of per event
+            area = context.area
+            if not area or area.type != 'SEQUENCE_EDITOR':
+                area = next((a for a in context.screen.areas if a.type == 'SEQUENCE_EDITOR'), None)
+            self._redraw_area = area
+            
             # CRITICAL: Disable transform gizmos during crop drag
             try:
                 if hasattr(context.space_data, 'show_gizmo'):
                     self._saved_gizmo_state = context.space_data.show_gizmo
                     context.space_data.show_gizmo = False
+                    track_gizmo_disabled_space(context.space_data)
             except Exception as e:
                 pass
             
@@ -303,6 +250,12 @@ class EASYCROP_GT_crop_handle(Gizmo):
                 self.crop_start = (strip.crop.min_x, strip.crop.max_x, strip.crop.min_y, strip.crop.max_y)
             else:
                 self.crop_start = (0, 0, 0, 0)
+            
+            # Rotation, flip, scale and size stay fixed for the whole drag
+            self._drag_draw_key = None
+            self._last_drag_delta = None
+            if strip:
+                self._store_drag_transform(strip, context.scene)
                 
             return {'RUNNING_MODAL'}
     
@@ -320,271 +273,104 @@ class EASYCROP_GT_crop_handle(Gizmo):
             # Fallback to zero delta if no initial position stored
             delta = (0, 0)
         
+        # Crop values follow from crop_start and the delta alone, so events that
+        # didn't move the mouse (timers, key repeats, coalesced moves) change nothing
+        if delta == self._last_drag_delta:
+            return {'RUNNING_MODAL'}
+        self._last_drag_delta = delta
+        
         # CORRECT APPROACH: Update crop values, NOT gizmo position
         # The gizmos should stay put while the strip gets smaller/larger
-        try:
-            strip = context.scene.sequence_editor.active_strip
-            if strip and hasattr(strip, 'crop'):
-                
-                # Update crop values (this will make the strip smaller/larger)
-                self._update_crop_from_gizmo_drag(context, delta, strip)
-                
-                
-                # Force redraw to show the cropping effect
-                for area in context.screen.areas:
-                    if area.type == 'SEQUENCE_EDITOR':
-                        area.tag_redraw()
-                
-                # The drawing handler should be handling the handle visibility
-                        
-                # DON'T move the gizmo - it should stay at the crop boundary
-                # This is the key difference from strip transform
-                        
-            else:
-                pass
-        except Exception as e:
-            pass
+        seq_editor = context.scene.sequence_editor
+        strip = seq_editor.active_strip if seq_editor else None
+        if strip and getattr(strip, 'crop', None) is not None:
+            
+            # Update crop values (this will make the strip smaller/larger)
+            self._update_crop_from_gizmo_drag(context, delta, strip)
+            
+            # Force redraw to show the cropping effect
+            if self._redraw_area:
+                self._redraw_area.tag_redraw()
+            
+            # The drawing handler should be handling the handle visibility
+            
+            # DON'T move the gizmo - it should stay at the crop boundary
+            # This is the key difference from strip transform
         
         return {'RUNNING_MODAL'}
     
     def _draw_handles_during_modal(self):
         """Custom drawing function to keep handles visible during modal"""
+        # Get current context - this is tricky in a drawing handler
+        context = bpy.context
+        
+        # Draw all handles manually using GPU drawing
+        scene = context.scene
+        seq_editor = scene.sequence_editor if scene else None
+        active_strip = seq_editor.active_strip if seq_editor else None
+        if not active_strip or getattr(active_strip, 'crop', None) is None:
+            return
+        
+        # Use direct GPU drawing to ensure handles are visible. The handler can
+        # outlive this gizmo when the preview closes mid-drag
         try:
-            # Get current context - this is tricky in a drawing handler
-            import bpy
-            context = bpy.context
-            
-            # Draw all handles manually using GPU drawing
-            scene = context.scene
-            if not scene.sequence_editor or not scene.sequence_editor.active_strip:
-                return
-                
-            active_strip = scene.sequence_editor.active_strip
-            if not hasattr(active_strip, 'crop'):
-                return
-            
-            # Use direct GPU drawing to ensure handles are visible
             self._draw_handles_with_gpu(context, active_strip, scene)
-                
-        except Exception as e:
+        except ReferenceError:
             pass
     
     def _draw_handles_with_gpu(self, context, strip, scene):
         """Draw handles directly with GPU during modal operations"""
-        try:
-            from ..operators.crop_core import get_strip_geometry_with_flip_support
-            
+        region = context.region
+        if not region or not region.view2d:
+            return
+        
+        view2d = region.view2d
+        
+        # Map view to screen with the view's scale and offset, like refresh()
+        mapping = get_view_mapping(view2d, scene.render.resolution_x, scene.render.resolution_y)
+        if mapping is None:
+            return
+        
+        # Only the crop and the view change during a drag - rotation, flip and
+        # scale are fixed. Redraws that change neither (timers, events that
+        # didn't move the crop) skip the geometry and reuse the last batch
+        crop = strip.crop
+        draw_key = (crop.min_x, crop.max_x, crop.min_y, crop.max_y, mapping)
+        color_shader = get_builtin_shader('FLAT_COLOR')
+        if draw_key != self._drag_draw_key:
             # Get strip geometry
             corners, (pivot_x, pivot_y), (scale_x, scale_y, flip_x, flip_y) = get_strip_geometry_with_flip_support(strip, scene)
             
-            # Calculate edge midpoints
-            edge_midpoints = []
-            for i in range(4):
-                next_i = (i + 1) % 4
-                midpoint = (corners[i] + corners[next_i]) / 2
-                edge_midpoints.append(midpoint)
+            # Handle points: 4 corners, 4 edge midpoints, then the pivot
+            points = [(corner.x, corner.y) for corner in corners]
+            points += [((x1 + x2) * 0.5, (y1 + y2) * 0.5)
+                       for (x1, y1), (x2, y2) in zip(points, points[1:] + points[:1])]
+            points.append((pivot_x, pivot_y))
             
             # Convert to screen coordinates
-            region = context.region
-            if not region or not region.view2d:
-                return
-                
-            view2d = region.view2d
-            res_x = scene.render.resolution_x
-            res_y = scene.render.resolution_y
-            
-            # Get shader for drawing
-            shader = gpu.shader.from_builtin('UNIFORM_COLOR')
-            gpu.state.blend_set('ALPHA')
-            
-            # Get which handle is being dragged (stored in handle_type and handle_index)
-            active_handle_type = getattr(self, 'handle_type', None)
-            active_handle_index = getattr(self, 'handle_index', None)
-            
-            # Also check for hover state from the gizmo system
-            is_highlighted = getattr(self, 'is_highlight', False)
-            
-            # Draw corner handles (squares)
-            for i, corner in enumerate(corners):
-                view_x = corner.x - res_x / 2
-                view_y = corner.y - res_y / 2
-                screen_co = view2d.view_to_region(view_x, view_y, clip=False)
-                
-                if screen_co:
-                    # Color priority: Active (dragging) > Hovered > Normal
-                    if active_handle_type == "corner" and active_handle_index == i:
-                        color = (1.0, 0.5, 0.0, 1.0)  # Orange for active (dragging) handle
-                    elif is_highlighted and active_handle_type == "corner" and active_handle_index == i:
-                        color = (1.0, 0.5, 0.0, 0.8)  # Orange for hovered handle
-                    else:
-                        color = (1.0, 1.0, 1.0, 0.8)  # White for inactive handles
-                    self._draw_square_at_position(shader, screen_co, color, 13)
-            
-            # Draw edge handles (squares)
-            for i, midpoint in enumerate(edge_midpoints):
-                view_x = midpoint.x - res_x / 2
-                view_y = midpoint.y - res_y / 2
-                screen_co = view2d.view_to_region(view_x, view_y, clip=False)
-                
-                if screen_co:
-                    # Color priority: Active (dragging) > Hovered > Normal
-                    if active_handle_type == "edge" and active_handle_index == i:
-                        color = (1.0, 0.5, 0.0, 1.0)  # Orange for active (dragging) handle
-                    elif is_highlighted and active_handle_type == "edge" and active_handle_index == i:
-                        color = (1.0, 0.5, 0.0, 0.8)  # Orange for hovered handle
-                    else:
-                        color = (1.0, 1.0, 1.0, 0.8)  # White for inactive handles
-                    self._draw_square_at_position(shader, screen_co, color, 13)
+            screen_points = map_points_to_region(mapping, points)
             
-            # Draw center handle (crop symbol)
-            center_view_x = pivot_x - res_x / 2
-            center_view_y = pivot_y - res_y / 2
-            center_screen = view2d.view_to_region(center_view_x, center_view_y, clip=False)
+            # Handle being dragged, as an index into the corner + edge points
+            active_index = self.handle_index + (4 if self.handle_type == "edge" else 0)
             
-            if center_screen:
-                self._draw_crop_symbol_at_position(shader, center_screen, (1.0, 1.0, 1.0, 0.8))
+            # Handle rotation with flip compensation - match crop_core.py logic
+            get_rotation = get_strip_accessors(strip)[0]
+            angle = get_rotation(strip)
+            if flip_x != flip_y:  # XOR - if only one axis is flipped
+                angle = -angle
             
-            
-        except Exception as e:
-            pass
-    
-    def _draw_square_at_position(self, shader, position, color, size):
-        """Draw a square handle at the given screen position with rotation like modal operator"""
-        try:
-            x, y = position
-            half_size = size / 2
-            
-            # This is used during modal drawing - apply rotation with flip compensation like modal operator
-            context = bpy.context
-            strip = context.scene.sequence_editor.active_strip
-            angle = 0
-            if strip:
-                if hasattr(strip, 'rotation_start'):
-                    angle = math.radians(strip.rotation_start)
-                elif hasattr(strip, 'rotation'):
-                    angle = strip.rotation
-                elif hasattr(strip, 'transform') and hasattr(strip.transform, 'rotation'):
-                    angle = strip.transform.rotation
-                
-                # Apply flip compensation - match crop_core.py logic
-                # Check for flip states
-                flip_x = False
-                flip_y = False
-                
-                for attr_name in ['use_flip_x', 'flip_x', 'mirror_x']:
-                    if hasattr(strip, attr_name):
-                        flip_x = getattr(strip, attr_name)
-                        break
-                
-                for attr_name in ['use_flip_y', 'flip_y', 'mirror_y']:
-                    if hasattr(strip, attr_name):
-                        flip_y = getattr(strip, attr_name)
-                        break
-                
-                # Apply flip compensation
-                if flip_x != flip_y:  # XOR - if only one axis is flipped
-                    angle = -angle
-            
-            # Create rotated square vertices exactly like modal operator  
-            if abs(angle) > 0.01:  # If strip is rotated
-                cos_a = math.cos(angle)
-                sin_a = math.sin(angle)
-                
-                # Define square corners relative to center - match modal operator exactly
-                corners_rel = [
-                    (-half_size, -half_size), (half_size, -half_size), 
-                    (half_size, half_size), (-half_size, half_size)
-                ]
-                
-                # Rotate and translate
-                vertices = []
-                for x_rel, y_rel in corners_rel:
-                    rot_x = x_rel * cos_a - y_rel * sin_a + x
-                    rot_y = x_rel * sin_a + y_rel * cos_a + y
-                    vertices.append((rot_x, rot_y))
-                
-                # Reorder vertices like modal operator for proper winding
-                vertices = [vertices[0], vertices[1], vertices[3], vertices[2]]
-            else:
-                # No rotation - regular square
-                vertices = [
-                    (x - half_size, y - half_size),
-                    (x + half_size, y - half_size),
-                    (x - half_size, y + half_size),
-                    (x + half_size, y + half_size)
-                ]
-            
-            indices = [(0, 1, 2), (2, 1, 3)]
-            
-            batch = batch_for_shader(shader, 'TRIS', {"pos": vertices}, indices=indices)
-            shader.bind()
-            shader.uniform_float("color", color)
-            batch.draw(shader)
-            
-        except Exception as e:
-            pass
-    
-    def _draw_crop_symbol_at_position(self, shader, position, color):
-        """Draw crop symbol at the given screen position - match normal gizmo version"""
-        try:
-            center_x, center_y = position
-            
-            # Symbol dimensions - match normal gizmo exactly
-            outer_size = 8
-            inner_size = 5
-            
-            line_shader = gpu.shader.from_builtin('UNIFORM_COLOR')
-            gpu.state.line_width_set(1.5)  # Match normal gizmo exactly
-            line_shader.bind()
-            line_shader.uniform_float("color", color)
-            
-            # Corner brackets - match normal gizmo exactly
-            # Top-left L-shape
-            tl_vertical = [
-                (center_x - outer_size, center_y + 1),
-                (center_x - outer_size, center_y + outer_size)
-            ]
-            tl_horizontal = [
-                (center_x - outer_size, center_y + outer_size),
-                (center_x - 1, center_y + outer_size)
-            ]
-            
-            # Bottom-right L-shape
-            br_horizontal = [
-                (center_x + 1, center_y - outer_size),
-                (center_x + outer_size, center_y - outer_size)
-            ]
-            br_vertical = [
-                (center_x + outer_size, center_y - outer_size),
-                (center_x + outer_size, center_y - 1)
-            ]
-            
-            # Inner viewing rectangle
-            inner_rect_lines = [
-                [(center_x - inner_size, center_y - inner_size), 
-                 (center_x + inner_size, center_y - inner_size)],
-                [(center_x + inner_size, center_y - inner_size),
-                 (center_x + inner_size, center_y + inner_size)],
-                [(center_x + inner_size, center_y + inner_size),
-                 (center_x - inner_size, center_y + inner_size)],
-                [(center_x - inner_size, center_y + inner_size),
-                 (center_x - inner_size, center_y - inner_size)]
-            ]
-            
-            # Draw all elements
-            for line_verts in [tl_vertical, tl_horizontal, br_horizontal, br_vertical]:
-                batch = batch_for_shader(line_shader, 'LINES', {"pos": line_verts})
-                batch.draw(line_shader)
-            
-            for line_verts in inner_rect_lines:
-                batch = batch_for_shader(line_shader, 'LINES', {"pos": line_verts})
-                batch.draw(line_shader)
-            
-            gpu.state.line_width_set(1.0)
-            
-        except Exception as e:
-            pass
-    
+            # All squares in one batch, colored per vertex
+            vertices, indices = _build_handle_squares(screen_points[:8], 13 / 2, math.cos(angle), math.sin(angle))
+            self._drag_batch = batch_for_shader(color_shader, 'TRIS', {"pos": vertices, "color": _DRAG_HANDLE_COLORS[active_index]}, indices=indices)
+            self._drag_symbol_position = screen_points[8]
+            self._drag_draw_key = draw_key
+        
+        gpu.state.blend_set('ALPHA')
+        color_shader.bind()
+        self._drag_batch.draw(color_shader)
+        
+        # Draw center handle (crop symbol)
+        self._draw_crop_symbol((1.0, 1.0, 1.0, 0.8), self._drag_symbol_position)
     
     def exit(self, context, cancel):
         """Handle gizmo exit"""
@@ -662,6 +448,7 @@ class EASYCROP_GT_crop_handle(Gizmo):
             try:
                 if hasattr(self, '_saved_gizmo_state') and hasattr(context.space_data, 'show_gizmo'):
                     context.space_data.show_gizmo = self._saved_gizmo_state
+                    untrack_gizmo_disabled_space(context.space_data)
             except Exception as e:
                 pass
             
@@ -675,16 +462,42 @@ class EASYCROP_GT_crop_handle(Gizmo):
                     strip.crop.max_y = int(self.crop_start[3])
                     
                     # Force redraw to show restored values
-                    for area in context.screen.areas:
-                        if area.type == 'SEQUENCE_EDITOR':
-                            area.tag_redraw()
-            else:
-                pass
+                    if self._redraw_area:
+                        self._redraw_area.tag_redraw()
+    
+    def _store_drag_transform(self, strip, scene):
+        """Resolve the strip properties used by every drag update (same as modal operator)"""
+        # Get strip scale
+        transform = getattr(strip, 'transform', None)
+        self._drag_scale_x = getattr(transform, 'scale_x', 1.0)
+        self._drag_scale_y = getattr(transform, 'scale_y', 1.0)
+        
+        # Check for flip states and rotation
+        get_rotation, get_flip_x, get_flip_y = get_strip_accessors(strip)
+        self._drag_flip_x = flip_x = get_flip_x(strip)
+        self._drag_flip_y = flip_y = get_flip_y(strip)
+        angle = -get_rotation(strip)
+        
+        # Adjust rotation for flip
+        if flip_x != flip_y:
+            angle = -angle
+        
+        # Crop sides moved by this handle - apply the same flip remapping as the modal operator
+        flips = (bool(flip_x), bool(flip_y))
+        if self.handle_type == "corner":
+            self._drag_crop_sides = CORNER_CROP_SIDES[CORNER_FLIP_REMAP[flips][self.handle_index]]
+        else:
+            self._drag_crop_sides = EDGE_CROP_SIDES[EDGE_FLIP_REMAP[flips][self.handle_index]]
+        
+        self._drag_rotated = angle != 0
+        self._drag_cos = math.cos(angle)
+        self._drag_sin = math.sin(angle)
+        
+        # Get strip dimensions
+        self._drag_strip_size = get_strip_size(strip, scene)
     
     def _update_crop_from_gizmo_drag(self, context, delta, strip):
         """Update crop values from gizmo drag (adapted from modal operator)"""
-        scene = context.scene
-        
         # Gizmo delta is already in screen pixel space, not normalized
         dx = delta[0]  # Screen space delta x in pixels
         dy = delta[1]  # Screen space delta y in pixels
@@ -702,162 +515,38 @@ class EASYCROP_GT_crop_handle(Gizmo):
         dx_view = p2[0] - p1[0]
         dy_view = p2[1] - p1[1]
         
-        # Get strip properties (same as modal operator)
-        strip_scale_x = strip.transform.scale_x if hasattr(strip, 'transform') and hasattr(strip.transform, 'scale_x') else 1.0
-        strip_scale_y = strip.transform.scale_y if hasattr(strip, 'transform') and hasattr(strip.transform, 'scale_y') else 1.0
-        
-        # Check for flip states (same as modal operator)
-        flip_x = False
-        flip_y = False
-        
-        for attr_name in ['use_flip_x', 'flip_x', 'mirror_x']:
-            if hasattr(strip, attr_name):
-                flip_x = getattr(strip, attr_name)
-                break
-        
-        for attr_name in ['use_flip_y', 'flip_y', 'mirror_y']:
-            if hasattr(strip, attr_name):
-                flip_y = getattr(strip, attr_name)
-                break
-        
-        # Handle rotation (same as modal operator)
-        angle = 0
-        if hasattr(strip, 'rotation_start'):
-            angle = -math.radians(strip.rotation_start)
-        elif hasattr(strip, 'transform') and hasattr(strip.transform, 'rotation'):
-            angle = -strip.transform.rotation
-        
-        # Adjust rotation for flip
-        if flip_x != flip_y:
-            angle = -angle
-        
-        # Apply rotation to delta
-        if angle != 0:
-            cos_a = math.cos(angle)
-            sin_a = math.sin(angle)
+        # Apply rotation to delta - cos/sin were resolved when the drag started
+        if self._drag_rotated:
+            cos_a = self._drag_cos
+            sin_a = self._drag_sin
             rotated_dx = dx_view * cos_a - dy_view * sin_a
             rotated_dy = dx_view * sin_a + dy_view * cos_a
             dx_view = rotated_dx
             dy_view = rotated_dy
         
         # Convert to strip's original image space
-        dx_res = dx_view / strip_scale_x
-        dy_res = dy_view / strip_scale_y
+        dx_res = dx_view / self._drag_scale_x
+        dy_res = dy_view / self._drag_scale_y
         
         # Invert deltas for flipped strips
+        flip_x = self._drag_flip_x
+        flip_y = self._drag_flip_y
         if flip_x:
             dx_res = -dx_res
         if flip_y:
             dy_res = -dy_res
         
-        # Get strip dimensions
-        strip_width = scene.render.resolution_x
-        strip_height = scene.render.resolution_y
-        
-        if hasattr(strip, 'elements') and strip.elements and len(strip.elements) > 0:
-            elem = strip.elements[0]
-            if hasattr(elem, 'orig_width') and hasattr(elem, 'orig_height'):
-                strip_width = elem.orig_width
-                strip_height = elem.orig_height
+        strip_width, strip_height = self._drag_strip_size
         
         # Apply crop changes based on handle type and index
-        self._apply_gizmo_crop_changes(strip, dx_res, dy_res, strip_width, strip_height, flip_x, flip_y)
+        self._apply_gizmo_crop_changes(strip, dx_res, dy_res, strip_width, strip_height)
     
-    def _apply_gizmo_crop_changes(self, strip, dx_res, dy_res, strip_width, strip_height, flip_x, flip_y):
+    def _apply_gizmo_crop_changes(self, strip, dx_res, dy_res, strip_width, strip_height):
         """Apply crop changes based on gizmo handle (adapted from modal operator)"""
         # CRITICAL FIX: Use stored initial values, not current crop values
         # This is the key difference from the old buggy approach
-        
-        if self.handle_type == "corner":
-            # Corner handles - remap based on flips (same as modal operator)
-            corner_map = self.handle_index
-            
-            # IMPORTANT: Apply the same flip remapping as the modal operator
-            if flip_x and flip_y:
-                corner_remap = {0: 2, 1: 3, 2: 0, 3: 1}
-                corner_map = corner_remap[self.handle_index]
-            elif flip_x:
-                corner_remap = {0: 3, 1: 2, 2: 1, 3: 0}
-                corner_map = corner_remap[self.handle_index]
-            elif flip_y:
-                corner_remap = {0: 1, 1: 0, 2: 3, 3: 2}
-                corner_map = corner_remap[self.handle_index]
-            
-            
-            # Apply crop changes based on remapped corner - using stored initial values
-            if corner_map == 0:  # Bottom-left
-                new_min_x = int(max(0, self.crop_start[0] + dx_res))
-                if new_min_x + strip.crop.max_x < strip_width:
-                    strip.crop.min_x = new_min_x
-                
-                new_min_y = int(max(0, self.crop_start[2] + dy_res))
-                if new_min_y + strip.crop.max_y < strip_height:
-                    strip.crop.min_y = new_min_y
-                        
-            elif corner_map == 1:  # Top-left
-                new_min_x = int(max(0, self.crop_start[0] + dx_res))
-                if new_min_x + strip.crop.max_x < strip_width:
-                    strip.crop.min_x = new_min_x
-                
-                new_max_y = int(max(0, self.crop_start[3] - dy_res))
-                if strip.crop.min_y + new_max_y < strip_height:
-                    strip.crop.max_y = new_max_y
-                        
-            elif corner_map == 2:  # Top-right
-                new_max_x = int(max(0, self.crop_start[1] - dx_res))
-                if strip.crop.min_x + new_max_x < strip_width:
-                    strip.crop.max_x = new_max_x
-                
-                new_max_y = int(max(0, self.crop_start[3] - dy_res))
-                if strip.crop.min_y + new_max_y < strip_height:
-                    strip.crop.max_y = new_max_y
-                        
-            elif corner_map == 3:  # Bottom-right
-                new_max_x = int(max(0, self.crop_start[1] - dx_res))
-                if strip.crop.min_x + new_max_x < strip_width:
-                    strip.crop.max_x = new_max_x
-                
-                new_min_y = int(max(0, self.crop_start[2] + dy_res))
-                if new_min_y + strip.crop.max_y < strip_height:
-                    strip.crop.min_y = new_min_y
-                    
-        elif self.handle_type == "edge":
-            # Edge handles - remap based on flips (same as modal operator)
-            edge_index = self.handle_index
-            edge_map = edge_index
-            
-            # IMPORTANT: Apply the same flip remapping as the modal operator
-            if flip_x and flip_y:
-                edge_remap = {0: 2, 1: 3, 2: 0, 3: 1}
-                edge_map = edge_remap[edge_index]
-            elif flip_x:
-                edge_remap = {0: 2, 1: 1, 2: 0, 3: 3}
-                edge_map = edge_remap[edge_index]
-            elif flip_y:
-                edge_remap = {0: 0, 1: 3, 2: 2, 3: 1}
-                edge_map = edge_remap[edge_index]
-            
-            
-            # Apply crop changes based on remapped edge - using stored initial values
-            if edge_map == 0:  # Left edge
-                new_min_x = int(max(0, self.crop_start[0] + dx_res))
-                if new_min_x + strip.crop.max_x < strip_width:
-                    strip.crop.min_x = new_min_x
-                        
-            elif edge_map == 1:  # Top edge
-                new_max_y = int(max(0, self.crop_start[3] - dy_res))
-                if strip.crop.min_y + new_max_y < strip_height:
-                    strip.crop.max_y = new_max_y
-                        
-            elif edge_map == 2:  # Right edge
-                new_max_x = int(max(0, self.crop_start[1] - dx_res))
-                if strip.crop.min_x + new_max_x < strip_width:
-                    strip.crop.max_x = new_max_x
-                        
-            elif edge_map == 3:  # Bottom edge
-                new_min_y = int(max(0, self.crop_start[2] + dy_res))
-                if new_min_y + strip.crop.max_y < strip_height:
-                    strip.crop.min_y = new_min_y
+        apply_crop_sides(strip.crop, self._drag_crop_sides, self.crop_start,
+                         dx_res, dy_res, strip_width, strip_height)
 
 
 class EASYCROP_GGT_crop_handles(GizmoGroup):
@@ -871,24 +560,38 @@ class EASYCROP_GGT_crop_handles(GizmoGroup):
     # Class variable to track if any gizmo is being dragged
     _drag_active = False
     
+    # Crop tool active state per workspace pointer, cleared when tools change
+    _tool_active_cache = {}
+    
     @classmethod
     def poll(cls, context):
         """Check if gizmo group should be active"""
         # Only show in VSE preview
-        if not context.space_data or context.space_data.type != 'SEQUENCE_EDITOR':
+        space = context.space_data
+        if not space or space.type != 'SEQUENCE_EDITOR':
             return False
-            
+        
+        # Only show gizmos when explicitly activated via toolbar. Checked first so
+        # the strip checks below are skipped whenever another tool is active
+        if not cls._is_crop_tool_active():
+            return False
+        
         # Check display mode
-        if hasattr(context.space_data, 'display_mode'):
-            if context.space_data.display_mode != 'IMAGE':
-                return False
+        if getattr(space, 'display_mode', 'IMAGE') != 'IMAGE':
+            return False
+        
+        # Don't show if modal crop mode is already active (avoid conflicts)
+        if get_crop_state()['active']:
+            return False
         
         # Only show when there's a sequence editor and active strip
-        if not context.scene.sequence_editor:
+        scene = context.scene
+        seq_editor = scene.sequence_editor
+        if not seq_editor:
             return False
             
-        active_strip = context.scene.sequence_editor.active_strip
-        if not active_strip or not hasattr(active_strip, 'crop'):
+        active_strip = seq_editor.active_strip
+        if not active_strip or getattr(active_strip, 'crop', None) is None:
             return False
         
         # IMPORTANT: Only show for SELECTED strips (fixes disappearing when deselected)
@@ -896,92 +599,50 @@ class EASYCROP_GGT_crop_handles(GizmoGroup):
             return False
             
         # Only show for visible strips
-        current_frame = context.scene.frame_current
-        if not is_strip_visible_at_frame(active_strip, current_frame):
+        if not is_strip_visible_at_frame(active_strip, scene.frame_current):
             return False
         
-        # Don't show if modal crop mode is already active (avoid conflicts)
-        crop_state = get_crop_state()
-        if crop_state['active']:
+        return True
+    
+    @classmethod
+    def _is_crop_tool_active(cls):
+        """Check if crop handles tool is active (toolbar button clicked)"""
+        workspace = getattr(bpy.context, 'workspace', None)
+        if not workspace:
             return False
         
-        # Check if crop handles tool is active (toolbar button clicked)
-        try:
-            # Method 1: Check workspace tool via bpy.context
-            if hasattr(bpy.context, 'workspace') and bpy.context.workspace:
-                workspace = bpy.context.workspace
-                
-                # Check active tool in sequencer space
-                if hasattr(workspace, 'tools') and workspace.tools:
-                    # Try to get the active tool for sequencer preview
-                    for tool in workspace.tools:
-                        if hasattr(tool, 'idname') and tool.idname == "sequencer.crop_handles_tool":
-                            return True
-            
-            # Method 2: Check via context.tool_settings if available
-            if hasattr(context, 'tool_settings'):
-                # This approach might work in some cases
-                pass
-                
-        except Exception as e:
-            pass
-        
-        # Only show gizmos when explicitly activated via toolbar
-        try:
-            if hasattr(bpy.context, 'workspace') and bpy.context.workspace:
-                workspace = bpy.context.workspace
-                for tool in workspace.tools:
-                    if hasattr(tool, 'idname') and tool.idname == "sequencer.crop_handles_tool":
-                        return True
-        except:
-            pass
-        
-        return False
+        # Scan the workspace tools once, until msgbus reports a tool change
+        key = workspace.as_pointer()
+        active = cls._tool_active_cache.get(key)
+        if active is None:
+            active = any(getattr(tool, 'idname', None) == "sequencer.crop_handles_tool"
+                         for tool in workspace.tools)
+            cls._tool_active_cache[key] = active
+        return active
     
     def setup(self, context):
         """Setup the gizmo group with all handles"""
         
-        # Create corner handles (4)
-        for i in range(4):
-            gizmo = self.gizmos.new(EASYCROP_GT_crop_handle.bl_idname)
-            # Set properties AFTER creation but BEFORE setup calls
-            gizmo.handle_type = "corner"
-            gizmo.handle_index = i
-            gizmo.select_id = i
-            
-            # CRITICAL: Configure gizmo for drag interaction
-            gizmo.use_event_handle_all = True
-            gizmo.use_draw_modal = True  
-            gizmo.use_grab_cursor = True
-            gizmo.use_draw_select = True  # Enable select drawing for visibility during modal
-            
-        
-        # Create edge handles (4)  
-        for i in range(4):
+        # Create corner (4), edge (4) and center (1) handles
+        for handle_type, handle_index, select_id in _HANDLE_SPEC:
             gizmo = self.gizmos.new(EASYCROP_GT_crop_handle.bl_idname)
             # Set properties AFTER creation but BEFORE setup calls
-            gizmo.handle_type = "edge"
-            gizmo.handle_index = i
-            gizmo.select_id = i + 4
+            gizmo.handle_type = handle_type
+            gizmo.handle_index = handle_index
+            gizmo.select_id = select_id
             
-            # CRITICAL: Configure gizmo for drag interaction
+            # CRITICAL: Configure gizmo for drag interaction - the center handle
+            # only needs click handling, but the gizmo setup() enables these anyway
             gizmo.use_event_handle_all = True
             gizmo.use_draw_modal = True
             gizmo.use_grab_cursor = True
             gizmo.use_draw_select = True  # Enable select drawing for visibility during modal
-            
-        
-        # Create center handle (1)
-        gizmo = self.gizmos.new(EASYCROP_GT_crop_handle.bl_idname)
-        # Set properties AFTER creation but BEFORE setup calls
-        gizmo.handle_type = "center"
-        gizmo.handle_index = 0
-        gizmo.select_id = 8
         
-        # Center handle needs click handling but not dragging
-        gizmo.use_event_handle_all = True
-        gizmo.use_draw_select = True  # Enable select drawing
+        # Inputs of the last handle placement, see refresh()
+        self._last_state = None
         
+        # Scratch translation matrix for unrotated handles, see refresh()
+        self._translation_basis = Matrix.Identity(4)
     
     def refresh(self, context):
         """Refresh gizmo positions"""
@@ -989,205 +650,142 @@ class EASYCROP_GGT_crop_handles(GizmoGroup):
         # This prevents the "all gizmos move with strip" issue
         if self._drag_active:
             return
+        
+        # Nothing to place while the preview region is collapsed or hidden
+        region = context.region
+        if not region or region.width <= 1 or region.height <= 1 or not region.view2d:
+            return
             
         scene = context.scene
-        if not scene.sequence_editor or not scene.sequence_editor.active_strip:
+        seq_editor = scene.sequence_editor
+        active_strip = seq_editor.active_strip if seq_editor else None
+        if not active_strip or getattr(active_strip, 'crop', None) is None:
             return
-            
-        active_strip = scene.sequence_editor.active_strip
-        if not hasattr(active_strip, 'crop'):
+        
+        # Skip repositioning when nothing that places the handles has changed.
+        # The values are read directly, since msgbus would miss flips on the
+        # concrete strip types and preview transform and source size edits made in C
+        render = scene.render
+        view2d = region.view2d
+        
+        # The view mapping also captures the preview pan and zoom
+        mapping = get_view_mapping(view2d, render.resolution_x, render.resolution_y)
+        if mapping is None:
+            return  # Degenerate view mapping
+        
+        crop = active_strip.crop
+        # Same defaults as get_strip_geometry_with_flip_support() for strips
+        # without a transform or scale
+        transform = getattr(active_strip, 'transform', None)
+        get_rotation, get_flip_x, get_flip_y = get_strip_accessors(active_strip)
+        state = (
+            active_strip.as_pointer(),
+            crop.min_x, crop.max_x, crop.min_y, crop.max_y,
+            getattr(transform, 'offset_x', 0), getattr(transform, 'offset_y', 0),
+            getattr(transform, 'scale_x', 1.0), getattr(transform, 'scale_y', 1.0),
+            get_rotation(active_strip), get_flip_x(active_strip), get_flip_y(active_strip),
+            get_strip_size(active_strip, scene),
+            render.resolution_x, render.resolution_y,
+            region.width, region.height,
+            mapping,
+        )
+        if state == self._last_state:
             return
-            
-        try:
-            
-            # Get strip geometry (same as modal operator)
-            corners, (pivot_x, pivot_y), (scale_x, scale_y, flip_x, flip_y) = get_strip_geometry_with_flip_support(active_strip, scene)
-            
-            # Calculate edge midpoints (same as modal operator)
-            edge_midpoints = []
-            for i in range(4):
-                next_i = (i + 1) % 4
-                midpoint = (corners[i] + corners[next_i]) / 2
-                edge_midpoints.append(midpoint)
-            
-            # Convert all positions to screen coordinates
-            res_x = scene.render.resolution_x
-            res_y = scene.render.resolution_y
-            region = context.region
-            
-            if region and region.view2d:
-                view2d = region.view2d
-                
-                # Position handles exactly like modal operator - no visual mapping at positioning level
-                # The flip remapping happens during crop value updates, not handle positioning
-                
-                # Convert corners to screen coordinates for rotation calculation
-                screen_corners = []
-                for corner in corners:
-                    view_x = corner.x - res_x / 2
-                    view_y = corner.y - res_y / 2
-                    screen_co = view2d.view_to_region(view_x, view_y, clip=False)
-                    screen_corners.append(Vector(screen_co))
-                
-                # Position corner handles (0-3) with geometry-based rotation like modal operator
-                for i in range(4):
-                    if i < len(self.gizmos):
-                        screen_co = screen_corners[i]
-                        
-                        # Calculate rotation based on geometry like fixed modal operator
-                        rotation_angle = 0
-                        
-                        # Check if we need rotation (same threshold as modal operator)
-                        raw_angle = 0
-                        if hasattr(active_strip, 'rotation_start'):
-                            raw_angle = math.radians(active_strip.rotation_start)
-                        elif hasattr(active_strip, 'transform') and hasattr(active_strip.transform, 'rotation'):
-                            raw_angle = active_strip.transform.rotation
-                        
-                        if abs(raw_angle) > 0.01:  # If strip is rotated
-                            # EXACT COPY of modal operator rotation calculation
-                            if i < 4:  # Corner handle - same as modal operator
-                                corner_idx = i
-                                prev_edge_idx = (corner_idx - 1) % 4
-                                next_edge_idx = corner_idx
-                                
-                                prev_corner1 = prev_edge_idx
-                                prev_corner2 = (prev_edge_idx + 1) % 4
-                                next_corner1 = next_edge_idx  
-                                next_corner2 = (next_edge_idx + 1) % 4
-                                
-                                prev_edge_vec = screen_corners[prev_corner2] - screen_corners[prev_corner1]
-                                next_edge_vec = screen_corners[next_corner2] - screen_corners[next_corner1]
-                                
-                                prev_edge_angle = math.atan2(prev_edge_vec.y, prev_edge_vec.x)
-                                next_edge_angle = math.atan2(next_edge_vec.y, next_edge_vec.x)
-                                
-                                rotation_angle = next_edge_angle - math.pi / 2  # Same as modal operator
-                            else:  # Edge handle - same as modal operator
-                                edge_idx = i - 4
-                                corner1_idx = edge_idx
-                                corner2_idx = (edge_idx + 1) % 4
-                                
-                                edge_vec = screen_corners[corner2_idx] - screen_corners[corner1_idx]
-                                edge_angle = math.atan2(edge_vec.y, edge_vec.x)
-                                rotation_angle = edge_angle - math.pi / 2  # Same as modal operator
-                        
-                        # Create transformation matrix with geometry-based rotation
-                        # Note: No flip compensation needed - crop_core already handles this
-                        transform_matrix = Matrix.Translation((screen_co[0], screen_co[1], 0))
-                        if abs(rotation_angle) > 0.01:  # Only apply rotation if significant
-                            rotation_matrix = Matrix.Rotation(rotation_angle, 4, 'Z')
-                            transform_matrix = transform_matrix @ rotation_matrix
-                        
-                        self.gizmos[i].matrix_basis = transform_matrix
-                        
-                        # CRITICAL: Force visibility
-                        self.gizmos[i].hide = False
-                        self.gizmos[i].alpha = 0.8
-                
-                # Position edge handles (4-7) with geometry-based rotation like modal operator
-                for i in range(4):
-                    gizmo_idx = i + 4
-                    if gizmo_idx < len(self.gizmos):
-                        midpoint = edge_midpoints[i]
-                        view_x = midpoint.x - res_x / 2
-                        view_y = midpoint.y - res_y / 2
-                        # Convert to screen coordinates like the modal operator does
-                        screen_co = view2d.view_to_region(view_x, view_y, clip=False)
-                        
-                        # Calculate rotation based on geometry like modal operator edge handles
-                        rotation_angle = 0
-                        
-                        # Check if we need rotation (same threshold as modal operator)
-                        raw_angle = 0
-                        if hasattr(active_strip, 'rotation_start'):
-                            raw_angle = math.radians(active_strip.rotation_start)
-                        elif hasattr(active_strip, 'transform') and hasattr(active_strip.transform, 'rotation'):
-                            raw_angle = active_strip.transform.rotation
-                        
-                        if abs(raw_angle) > 0.01:  # If strip is rotated
-                            # EXACT COPY of modal operator rotation calculation
-                            if i < 4:  # Corner handle - same as modal operator
-                                corner_idx = i
-                                prev_edge_idx = (corner_idx - 1) % 4
-                                next_edge_idx = corner_idx
-                                
-                                prev_corner1 = prev_edge_idx
-                                prev_corner2 = (prev_edge_idx + 1) % 4
-                                next_corner1 = next_edge_idx  
-                                next_corner2 = (next_edge_idx + 1) % 4
-                                
-                                prev_edge_vec = screen_corners[prev_corner2] - screen_corners[prev_corner1]
-                                next_edge_vec = screen_corners[next_corner2] - screen_corners[next_corner1]
-                                
-                                prev_edge_angle = math.atan2(prev_edge_vec.y, prev_edge_vec.x)
-                                next_edge_angle = math.atan2(next_edge_vec.y, next_edge_vec.x)
-                                
-                                rotation_angle = next_edge_angle - math.pi / 2  # Same as modal operator
-                            else:  # Edge handle - same as modal operator
-                                edge_idx = i - 4
-                                corner1_idx = edge_idx
-                                corner2_idx = (edge_idx + 1) % 4
-                                
-                                edge_vec = screen_corners[corner2_idx] - screen_corners[corner1_idx]
-                                edge_angle = math.atan2(edge_vec.y, edge_vec.x)
-                                rotation_angle = edge_angle - math.pi / 2  # Same as modal operator
-                        
-                        # Create transformation matrix with geometry-based rotation
-                        # Note: No flip compensation needed - crop_core already handles this
-                        transform_matrix = Matrix.Translation((screen_co[0], screen_co[1], 0))
-                        if abs(rotation_angle) > 0.01:  # Only apply rotation if significant
-                            rotation_matrix = Matrix.Rotation(rotation_angle, 4, 'Z')
-                            transform_matrix = transform_matrix @ rotation_matrix
-                        
-                        self.gizmos[gizmo_idx].matrix_basis = transform_matrix
-                        
-                        # CRITICAL: Force visibility
-                        self.gizmos[gizmo_idx].hide = False
-                        self.gizmos[gizmo_idx].alpha = 0.8
-                
-                # Position center handle (8)
-                if len(self.gizmos) > 8:
-                    view_x = pivot_x - res_x / 2
-                    view_y = pivot_y - res_y / 2
-                    # Convert to screen coordinates like the modal operator does
-                    screen_co = view2d.view_to_region(view_x, view_y, clip=False)
-                    self.gizmos[8].matrix_basis = Matrix.Translation((screen_co[0], screen_co[1], 0))
-                    
-                    # CRITICAL: Force visibility
-                    self.gizmos[8].hide = False
-                    self.gizmos[8].alpha = 0.8
-            
-        except Exception as e:
-            pass
-    
-    def draw_prepare(self, context):
-        """Prepare for drawing"""
-        self.refresh(context)
-    
-    def draw_select(self, context):
-        """Draw during modal operations - ensure handles stay visible"""
-        # Force all handles to draw during modal operations
-        # This helps keep non-active handles visible during drag operations
-        try:
-            # Get strip geometry for drawing all handles
-            scene = context.scene
-            if scene.sequence_editor and scene.sequence_editor.active_strip:
-                active_strip = scene.sequence_editor.active_strip
-                if hasattr(active_strip, 'crop'):
-                    # Draw all handles manually during modal
-                    self._draw_all_handles_manual(context, during_modal=True)
-        except Exception as e:
-            pass
+        self._last_state = state
+        
+        # Get strip geometry (same as modal operator)
+        corners, (pivot_x, pivot_y), (scale_x, scale_y, flip_x, flip_y) = get_strip_geometry_with_flip_support(active_strip, scene)
+        
+        # Position handles exactly like modal operator - no visual mapping at positioning level
+        # The flip remapping happens during crop value updates, not handle positioning
+        
+        # Handle points: 4 corners, 4 edge midpoints (same as modal operator), then the pivot
+        points = [(corner.x, corner.y) for corner in corners]
+        points += [((x1 + x2) * 0.5, (y1 + y2) * 0.5)
+                   for (x1, y1), (x2, y2) in zip(points, points[1:] + points[:1])]
+        points.append((pivot_x, pivot_y))
+        
+        # Convert all 9 points to screen coordinates with the view mapping
+        screen_points = map_points_to_region(mapping, points)
+        
+        gizmos = self.gizmos
+        
+        # Common case: unrotated strip. matrix_basis copies on assignment, so
+        # every handle reuses one translation matrix
+        # Note: No flip compensation needed - crop_core already handles this
+        if abs(get_rotation(active_strip)) <= 0.01:  # Same threshold as modal operator
+            basis = self._translation_basis
+            for gizmo, (x, y) in zip(gizmos, screen_points):
+                basis[0][3] = x
+                basis[1][3] = y
+                gizmo.matrix_basis = basis
+                
+                # CRITICAL: Force visibility - only written when it changed, alpha
+                # is stored as a float32 so compare with a tolerance
+                if gizmo.hide:
+                    gizmo.hide = False
+                if abs(gizmo.alpha - 0.8) > 1e-6:
+                    gizmo.alpha = 0.8
+            return
+        
+        # Geometry-based handle rotation like the modal operator: corner i and
+        # edge i both follow the screen direction of edge i (corner i -> i + 1).
+        # Resolved to (cos, sin) once per edge
+        edge_rotations = [(1.0, 0.0)] * 4
+        for i in range(4):
+            x1, y1 = screen_points[i]
+            x2, y2 = screen_points[(i + 1) % 4]
+            rotation_angle = math.atan2(y2 - y1, x2 - x1) - math.pi / 2
+            if abs(rotation_angle) > 0.01:  # Only apply rotation if significant
+                edge_rotations[i] = (math.cos(rotation_angle), math.sin(rotation_angle))
+        
+        # Position corner (0-3), edge (4-7) and center (8) handles in one pass.
+        # Corner and edge i share the rotation of edge i; the center is never rotated.
+        # The Z rotation and translation are written straight into one matrix
+        # instead of composing Matrix.Translation @ Matrix.Rotation per handle
+        basis = Matrix.Identity(4)
+        handle_rotations = edge_rotations * 2 + [(1.0, 0.0)]
+        for gizmo, (x, y), (cos_a, sin_a) in zip(gizmos, screen_points, handle_rotations):
+            basis[0][0] = cos_a
+            basis[0][1] = -sin_a
+            basis[1][0] = sin_a
+            basis[1][1] = cos_a
+            basis[0][3] = x
+            basis[1][3] = y
+            gizmo.matrix_basis = basis
+            
+            # CRITICAL: Force visibility - only written when it changed, alpha
+            # is stored as a float32 so compare with a tolerance
+            if gizmo.hide:
+                gizmo.hide = False
+            if abs(gizmo.alpha - 0.8) > 1e-6:
+                gizmo.alpha = 0.8
     
-    def _draw_all_handles_manual(self, context, during_modal=False):
-        """Manually draw all handles - fallback for modal operations"""
-        try:
-            for i, gizmo in enumerate(self.gizmos):
-                if hasattr(gizmo, '_draw_handle_common'):
-                    gizmo._draw_handle_common(context, during_modal=during_modal)
-        except Exception as e:
-            pass
+    # Drawing only needs the handles placed, which refresh() already does
+    draw_prepare = refresh
+
+
+# Owner of the msgbus subscription that invalidates the crop tool cache
+_msgbus_owner = object()
+
+
+def _clear_tool_active_cache(*args):
+    """Forget the cached crop tool state after a tool change"""
+    EASYCROP_GGT_crop_handles._tool_active_cache.clear()
+
+
+def _subscribe_tool_changes():
+    """Subscribe to tool changes to invalidate the crop tool cache"""
+    # The tool system publishes WorkSpace.tools whenever a tool is activated
+    bpy.msgbus.subscribe_rna(
+        key=(bpy.types.WorkSpace, "tools"), owner=_msgbus_owner, args=(), notify=_clear_tool_active_cache)
+
+
+@persistent
+def _on_load_post(*args):
+    """Loading a file clears msgbus subscriptions - subscribe again"""
+    _clear_tool_active_cache()
+    _subscribe_tool_changes()
 
 
 def register_crop_handles_gizmo():
@@ -1198,18 +796,18 @@ def register_crop_handles_gizmo():
         
         bpy.utils.register_class(EASYCROP_GGT_crop_handles)
         
+        # Forget the cached crop tool state whenever the active tool changes
+        _subscribe_tool_changes()
+        bpy.app.handlers.load_post.append(_on_load_post)
+        
         # Ensure the gizmo group type is active
         try:
             wm = bpy.context.window_manager
             if hasattr(wm, 'gizmo_group_type_ensure'):
                 wm.gizmo_group_type_ensure(EASYCROP_GGT_crop_handles.bl_idname)
-        except Exception as e:
-            pass
+        except Exception:
             # This error is expected for PERSISTENT gizmo groups
-            if "PERSISTENT" in str(e):
-                pass
-            else:
-                pass
+            pass
             
         return True
         
@@ -1220,6 +818,9 @@ def register_crop_handles_gizmo():
 def unregister_crop_handles_gizmo():
     """Unregister the crop handles gizmo classes"""
     try:
+        bpy.msgbus.clear_by_owner(_msgbus_owner)
+        if _on_load_post in bpy.app.handlers.load_post:
+            bpy.app.handlers.load_post.remove(_on_load_post)
         
         bpy.utils.unregister_class(EASYCROP_GGT_crop_handles)
         
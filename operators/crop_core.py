@@ -7,12 +7,44 @@ and utility functions that other crop modules depend on.
 
 import bpy
 import math
+from operator import attrgetter
 from mathutils import Vector
 
 # Global state variables
 _draw_handle = None
 _draw_data = {}
 _crop_active = False
+_gizmo_disabled_spaces = set()
+_strip_accessor_cache = {}
+
+# Degrees to radians factor for legacy rotation_start values
+DEG_TO_RAD = math.pi / 180.0
+
+# Crop side moved by a handle: (field, opposite field, crop_start index, delta sign, axis)
+_LEFT = ('min_x', 'max_x', 0, 1, 0)
+_RIGHT = ('max_x', 'min_x', 1, -1, 0)
+_BOTTOM = ('min_y', 'max_y', 2, 1, 1)
+_TOP = ('max_y', 'min_y', 3, -1, 1)
+
+# Sides moved by each corner (bottom-left, top-left, top-right, bottom-right)
+CORNER_CROP_SIDES = ((_LEFT, _BOTTOM), (_LEFT, _TOP), (_RIGHT, _TOP), (_RIGHT, _BOTTOM))
+
+# Side moved by each edge (left, top, right, bottom)
+EDGE_CROP_SIDES = ((_LEFT,), (_TOP,), (_RIGHT,), (_BOTTOM,))
+
+# Handle index remaps for flipped strips, keyed by (flip_x, flip_y)
+CORNER_FLIP_REMAP = {
+    (False, False): (0, 1, 2, 3),
+    (True, True): (2, 3, 0, 1),
+    (True, False): (3, 2, 1, 0),
+    (False, True): (1, 0, 3, 2),
+}
+EDGE_FLIP_REMAP = {
+    (False, False): (0, 1, 2, 3),
+    (True, True): (2, 3, 0, 1),
+    (True, False): (2, 1, 0, 3),
+    (False, True): (0, 3, 2, 1),
+}
 
 
 def is_strip_visible_at_frame(strip, frame):
@@ -41,6 +73,17 @@ def point_in_polygon(point, polygon):
     return inside
 
 
+def apply_crop_sides(crop, sides, crop_start, dx_res, dy_res, strip_width, strip_height):
+    """Move crop sides from their drag start values, keeping the crop inside the strip"""
+    deltas = (dx_res, dy_res)
+    limits = (strip_width, strip_height)
+    for field, opposite, start_index, sign, axis in sides:
+        value = int(max(0, crop_start[start_index] + sign * deltas[axis]))
+        # Skip unchanged values - every RNA write triggers an update and redraw
+        if value != getattr(crop, field) and value + getattr(crop, opposite) < limits[axis]:
+            setattr(crop, field, value)
+
+
 def rotate_point(point, angle, origin=None):
     """Rotate a 2D point around an origin"""
     if origin is None:
@@ -61,6 +104,77 @@ def rotate_point(point, angle, origin=None):
     return Vector([new_x + origin.x, new_y + origin.y])
 
 
+def get_strip_accessors(strip):
+    """Get the (rotation, flip_x, flip_y) getters for the strip's type"""
+    accessors = _strip_accessor_cache.get(type(strip))
+    if accessors is None:
+        # Probe the attribute names once - rotation is returned in radians
+        if hasattr(strip, 'rotation_start'):
+            get_rotation = lambda s: s.rotation_start * DEG_TO_RAD
+        elif hasattr(strip, 'rotation'):
+            get_rotation = attrgetter('rotation')
+        elif hasattr(strip, 'transform') and hasattr(strip.transform, 'rotation'):
+            get_rotation = attrgetter('transform.rotation')
+        else:
+            get_rotation = lambda s: 0
+        
+        # Check various possible flip attribute names
+        flip_getters = []
+        for attr_names in (('use_flip_x', 'flip_x', 'mirror_x'), ('use_flip_y', 'flip_y', 'mirror_y')):
+            attr_name = next((name for name in attr_names if hasattr(strip, name)), None)
+            flip_getters.append(attrgetter(attr_name) if attr_name else lambda s: False)
+        
+        accessors = (get_rotation, *flip_getters)
+        _strip_accessor_cache[type(strip)] = accessors
+    return accessors
+
+
+def get_strip_size(strip, scene):
+    """Get the strip's source image size, falling back to the render resolution"""
+    elements = getattr(strip, 'elements', None)
+    if elements:
+        elem = elements[0]
+        width = getattr(elem, 'orig_width', None)
+        height = getattr(elem, 'orig_height', None)
+        if width is not None and height is not None:
+            return width, height
+    return scene.render.resolution_x, scene.render.resolution_y
+
+
+def get_view_mapping(view2d, res_x, res_y):
+    """
+    Get the (offset_x, offset_y, zoom_x, zoom_y) mapping from resolution space
+    to region coordinates
+    Returns None when the view has no usable mapping
+    """
+    # The preview maps view to region space with a per-axis scale and offset.
+    # Recover it from two region pixels instead of one view_to_region per point
+    origin_x, origin_y = view2d.region_to_view(0, 0)
+    unit_x, unit_y = view2d.region_to_view(1, 1)
+    if unit_x == origin_x or unit_y == origin_y:
+        return None
+    
+    return (res_x / 2 + origin_x, res_y / 2 + origin_y,
+            1.0 / (unit_x - origin_x), 1.0 / (unit_y - origin_y))
+
+
+def map_points_to_region(mapping, points):
+    """Convert (x, y) points in resolution space to region coordinates with a view mapping"""
+    offset_x, offset_y, zoom_x, zoom_y = mapping
+    return [((x - offset_x) * zoom_x, (y - offset_y) * zoom_y) for x, y in points]
+
+
+def resolution_points_to_region(view2d, points, res_x, res_y):
+    """
+    Convert (x, y) points in resolution space to region coordinates
+    Returns None when the view has no usable mapping
+    """
+    mapping = get_view_mapping(view2d, res_x, res_y)
+    if mapping is None:
+        return None
+    return map_points_to_region(mapping, points)
+
+
 def get_strip_geometry_with_flip_support(strip, scene):
     """
     Calculate strip geometry accounting for Mirror X/Y checkboxes
@@ -70,51 +184,20 @@ def get_strip_geometry_with_flip_support(strip, scene):
     res_y = scene.render.resolution_y
     
     # Get actual strip dimensions
-    strip_width = res_x
-    strip_height = res_y
-    
-    if hasattr(strip, 'elements') and strip.elements and len(strip.elements) > 0:
-        elem = strip.elements[0]
-        if hasattr(elem, 'orig_width') and hasattr(elem, 'orig_height'):
-            strip_width = elem.orig_width
-            strip_height = elem.orig_height
+    strip_width, strip_height = get_strip_size(strip, scene)
     
     # Get scale and base transform
-    scale_x = 1.0
-    scale_y = 1.0
-    offset_x = 0
-    offset_y = 0
-    
-    if hasattr(strip, 'transform'):
-        offset_x = strip.transform.offset_x
-        offset_y = strip.transform.offset_y
-        if hasattr(strip.transform, 'scale_x'):
-            scale_x = strip.transform.scale_x
-            scale_y = strip.transform.scale_y
-    
-    # Check for Mirror X/Y checkboxes
-    flip_x = False
-    flip_y = False
-    
-    # Check various possible flip attribute names
-    for attr_name in ['use_flip_x', 'flip_x', 'mirror_x']:
-        if hasattr(strip, attr_name):
-            flip_x = getattr(strip, attr_name)
-            break
-    
-    for attr_name in ['use_flip_y', 'flip_y', 'mirror_y']:
-        if hasattr(strip, attr_name):
-            flip_y = getattr(strip, attr_name)
-            break
-    
-    # Get rotation angle
-    angle = 0
-    if hasattr(strip, 'rotation_start'):
-        angle = math.radians(strip.rotation_start)
-    elif hasattr(strip, 'rotation'):
-        angle = strip.rotation
-    elif hasattr(strip, 'transform') and hasattr(strip.transform, 'rotation'):
-        angle = strip.transform.rotation
+    transform = getattr(strip, 'transform', None)
+    offset_x = getattr(transform, 'offset_x', 0)
+    offset_y = getattr(transform, 'offset_y', 0)
+    scale_x = getattr(transform, 'scale_x', 1.0)
+    scale_y = getattr(transform, 'scale_y', 1.0)
+    
+    # Check for Mirror X/Y checkboxes and get rotation angle
+    get_rotation, get_flip_x, get_flip_y = get_strip_accessors(strip)
+    flip_x = get_flip_x(strip)
+    flip_y = get_flip_y(strip)
+    angle = get_rotation(strip)
     
     # Get crop values
     crop_left = 0
@@ -122,11 +205,12 @@ def get_strip_geometry_with_flip_support(strip, scene):
     crop_bottom = 0
     crop_top = 0
     
-    if hasattr(strip, 'crop'):
-        crop_left = float(strip.crop.min_x)
-        crop_right = float(strip.crop.max_x)
-        crop_bottom = float(strip.crop.min_y)
-        crop_top = float(strip.crop.max_y)
+    crop = getattr(strip, 'crop', None)
+    if crop:
+        crop_left = float(crop.min_x)
+        crop_right = float(crop.max_x)
+        crop_bottom = float(crop.min_y)
+        crop_top = float(crop.max_y)
     
     # Calculate scaled dimensions
     scaled_width = strip_width * scale_x
@@ -233,4 +317,19 @@ def clear_crop_state():
     global _crop_active, _draw_data, _draw_handle
     _crop_active = False
     _draw_data.clear()
-    _draw_handle = None
\ No newline at end of file
+    _draw_handle = None
+
+
+def track_gizmo_disabled_space(space):
+    """Remember a space whose transform gizmos were hidden by the addon"""
+    _gizmo_disabled_spaces.add(space.as_pointer())
+
+
+def untrack_gizmo_disabled_space(space):
+    """Forget a space once its transform gizmos have been restored"""
+    _gizmo_disabled_spaces.discard(space.as_pointer())
+
+
+def get_gizmo_disabled_spaces():
+    """Get the pointers of spaces whose transform gizmos are hidden"""
+    return _gizmo_disabled_spaces
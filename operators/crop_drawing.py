@@ -7,18 +7,70 @@ including drawing handles, crop outlines, and the crop symbol.
 
 import bpy
 import gpu
-import math
 from gpu_extras.batch import batch_for_shader
+from mathutils import Matrix
 
 from .crop_core import (
     get_crop_state, get_draw_data, 
-    get_strip_geometry_with_flip_support, is_strip_visible_at_frame
+    get_strip_geometry_with_flip_support, is_strip_visible_at_frame, get_strip_accessors,
+    resolution_points_to_region
 )
 
 
+# Unit handle square in triangle order, and the two triangles covering it
+SQUARE_OFFSETS = ((-1, -1), (1, -1), (-1, 1), (1, 1))
+SQUARE_INDICES = ((0, 1, 2), (2, 1, 3))
+
+# Crop symbol line segment endpoints relative to its center: two outer
+# L-shapes (outer size 8) around an inner viewing rectangle (size 5)
+CROP_SYMBOL_OFFSETS = (
+    # Top-left L-shape
+    (-8, 1), (-8, 8), (-8, 8), (-1, 8),
+    # Bottom-right L-shape
+    (1, -8), (8, -8), (8, -8), (8, -1),
+    # Inner viewing rectangle
+    (-5, -5), (5, -5), (5, -5), (5, 5),
+    (5, 5), (-5, 5), (-5, 5), (-5, -5),
+)
+
+# Builtin shaders by name, fetched on first use since they need a GPU context
+_builtin_shaders = {}
+
+# Unit handle square batch shared by the modal overlay and every handle
+# gizmo, built on first draw
+_square_batch = None
+
+# Crop symbol line batch around the origin, shared the same way
+_symbol_batch = None
+
+
+def get_builtin_shader(name):
+    """Get a builtin GPU shader, fetched once per session"""
+    shader = _builtin_shaders.get(name)
+    if shader is None:
+        shader = _builtin_shaders[name] = gpu.shader.from_builtin(name)
+    return shader
+
+
+def get_square_batch(shader):
+    """Get the unit handle square batch, built once around the origin"""
+    global _square_batch
+    if _square_batch is None:
+        _square_batch = batch_for_shader(shader, 'TRIS', {"pos": SQUARE_OFFSETS}, indices=SQUARE_INDICES)
+    return _square_batch
+
+
+def get_symbol_batch(shader):
+    """Get the crop symbol line batch, built once around the origin"""
+    global _symbol_batch
+    if _symbol_batch is None:
+        _symbol_batch = batch_for_shader(shader, 'LINES', {"pos": CROP_SYMBOL_OFFSETS})
+    return _symbol_batch
+
+
 def draw_line(v1, v2, width, color):
     """Draw a line between two points"""
-    shader = gpu.shader.from_builtin('UNIFORM_COLOR')
+    shader = get_builtin_shader('UNIFORM_COLOR')
     gpu.state.line_width_set(width)
     vertices = [v1, v2]
     batch = batch_for_shader(shader, 'LINES', {"pos": vertices})
@@ -76,41 +128,29 @@ def draw_crop_handles():
     # Get current geometry
     corners, (pivot_x, pivot_y), (scale_x, scale_y, flip_x, flip_y) = get_strip_geometry_with_flip_support(strip, scene)
     
-    # Calculate edge midpoints
-    edge_midpoints = []
-    for i in range(4):
-        next_i = (i + 1) % 4
-        midpoint = (corners[i] + corners[next_i]) / 2
-        edge_midpoints.append(midpoint)
-    
     # Get preview transform
     region = context.region
     if not region:
         return
     
-    view2d = context.region.view2d
-    res_x = scene.render.resolution_x
-    res_y = scene.render.resolution_y
+    # Handle points: 4 corners, 4 edge midpoints, then the pivot
+    points = [(corner.x, corner.y) for corner in corners]
+    points += [((x1 + x2) * 0.5, (y1 + y2) * 0.5)
+               for (x1, y1), (x2, y2) in zip(points, points[1:] + points[:1])]
+    points.append((pivot_x, pivot_y))
     
     # Transform to screen coordinates
-    screen_corners = []
-    for corner in corners:
-        view_x = corner.x - res_x / 2
-        view_y = corner.y - res_y / 2
-        screen_co = view2d.view_to_region(view_x, view_y, clip=False)
-        screen_corners.append(screen_co)
-    
-    screen_midpoints = []
-    for midpoint in edge_midpoints:
-        view_x = midpoint.x - res_x / 2
-        view_y = midpoint.y - res_y / 2
-        screen_co = view2d.view_to_region(view_x, view_y, clip=False)
-        screen_midpoints.append(screen_co)
+    screen_points = resolution_points_to_region(
+        region.view2d, points, scene.render.resolution_x, scene.render.resolution_y)
+    if not screen_points:
+        return
+    screen_corners = screen_points[:4]
+    screen_midpoints = screen_points[4:8]
     
     # No crop outline - clean handles-only approach
     
     # Draw crop symbol at center
-    _draw_crop_symbol(view2d, pivot_x, pivot_y, res_x, res_y)
+    _draw_crop_symbol(screen_points[8])
     
     # Detect hover for feedback
     hover_corner = _get_hovered_corner(screen_corners, screen_midpoints, mouse_x, mouse_y)
@@ -119,70 +159,22 @@ def draw_crop_handles():
     _draw_crop_handles(screen_corners, screen_midpoints, active_corner, hover_corner, strip, flip_x, flip_y, active_color, hover_color, handle_color)
 
 
-def _draw_crop_symbol(view2d, pivot_x, pivot_y, res_x, res_y):
+def _draw_crop_symbol(screen_center):
     """Draw the crop symbol at the strip center"""
-    # Transform to screen coordinates
-    screen_center = view2d.view_to_region(
-        pivot_x - res_x / 2,
-        pivot_y - res_y / 2,
-        clip=False
-    )
-    center_x = screen_center[0]
-    center_y = screen_center[1]
-    
     # Draw clean white crop symbol
     white_color = (1.0, 1.0, 1.0, 0.8)
-    line_shader = gpu.shader.from_builtin('UNIFORM_COLOR')
-    
-    # Symbol dimensions
-    outer_size = 8
-    inner_size = 5
+    line_shader = get_builtin_shader('UNIFORM_COLOR')
+    batch = get_symbol_batch(line_shader)
     
     gpu.state.line_width_set(1.5)
     line_shader.bind()
     line_shader.uniform_float("color", white_color)
     
-    # Corner brackets
-    # Top-left L-shape
-    tl_vertical = [
-        (center_x - outer_size, center_y + 1),
-        (center_x - outer_size, center_y + outer_size)
-    ]
-    tl_horizontal = [
-        (center_x - outer_size, center_y + outer_size),
-        (center_x - 1, center_y + outer_size)
-    ]
-    
-    # Bottom-right L-shape
-    br_horizontal = [
-        (center_x + 1, center_y - outer_size),
-        (center_x + outer_size, center_y - outer_size)
-    ]
-    br_vertical = [
-        (center_x + outer_size, center_y - outer_size),
-        (center_x + outer_size, center_y - 1)
-    ]
-    
-    # Inner viewing rectangle
-    inner_rect_lines = [
-        [(center_x - inner_size, center_y - inner_size), 
-         (center_x + inner_size, center_y - inner_size)],
-        [(center_x + inner_size, center_y - inner_size),
-         (center_x + inner_size, center_y + inner_size)],
-        [(center_x + inner_size, center_y + inner_size),
-         (center_x - inner_size, center_y + inner_size)],
-        [(center_x - inner_size, center_y + inner_size),
-         (center_x - inner_size, center_y - inner_size)]
-    ]
-    
-    # Draw all elements
-    for line_verts in [tl_vertical, tl_horizontal, br_horizontal, br_vertical]:
-        batch = batch_for_shader(line_shader, 'LINES', {"pos": line_verts})
-        batch.draw(line_shader)
-    
-    for line_verts in inner_rect_lines:
-        batch = batch_for_shader(line_shader, 'LINES', {"pos": line_verts})
-        batch.draw(line_shader)
+    # Draw the cached symbol translated to the center
+    gpu.matrix.push()
+    gpu.matrix.translate(screen_center)
+    batch.draw(line_shader)
+    gpu.matrix.pop()
     
     gpu.state.line_width_set(1.0)
 
@@ -190,38 +182,41 @@ def _draw_crop_symbol(view2d, pivot_x, pivot_y, res_x, res_y):
 def _get_hovered_corner(screen_corners, screen_midpoints, mouse_x, mouse_y):
     """Detect which handle is being hovered over"""
     all_handle_positions = screen_corners + screen_midpoints
-    threshold = 15  # Same threshold as modal operator
+    threshold_sq = 15 * 15  # Same threshold as modal operator, squared
     
-    for i, pos in enumerate(all_handle_positions):
-        distance = ((pos[0] - mouse_x)**2 + (pos[1] - mouse_y)**2)**0.5
-        if distance <= threshold:
+    for i, (x, y) in enumerate(all_handle_positions):
+        dx = x - mouse_x
+        dy = y - mouse_y
+        if dx * dx + dy * dy <= threshold_sq:
             return i
     return -1
 
 
 def _draw_crop_handles(screen_corners, screen_midpoints, active_corner, hover_corner, strip, flip_x, flip_y, active_color, hover_color, handle_color):
     """Draw the corner and edge handles"""
-    shader = gpu.shader.from_builtin('UNIFORM_COLOR')
+    shader = get_builtin_shader('UNIFORM_COLOR')
     
     all_handle_positions = screen_corners + screen_midpoints
     
     # Get rotation angle for handle orientation with flip compensation
-    angle = 0
-    if hasattr(strip, 'rotation_start'):
-        angle = math.radians(strip.rotation_start)
-    elif hasattr(strip, 'rotation'):
-        angle = strip.rotation
-    elif hasattr(strip, 'transform') and hasattr(strip.transform, 'rotation'):
-        angle = strip.transform.rotation
+    angle = get_strip_accessors(strip)[0](strip)
     
     # Apply flip compensation - match crop_core.py logic
     if flip_x != flip_y:  # XOR - if only one axis is flipped
         angle = -angle
     
+    # Rotate and scale the shared unit square - consistent size like gizmo version.
+    # Only the translation changes per handle, so no batch is built per frame
+    size = 6
+    if abs(angle) > 0.01:  # If strip is rotated
+        handle_matrix = Matrix.Rotation(angle, 4, 'Z') @ Matrix.Diagonal((size, size, 1.0, 1.0))
+    else:
+        handle_matrix = Matrix.Diagonal((size, size, 1.0, 1.0))
+    
+    batch = get_square_batch(shader)
+    shader.bind()
     for i, pos in enumerate(all_handle_positions):
-        # Determine color based on state - consistent size like gizmo version
-        size = 6  # Consistent size for all states
-        
+        # Determine color based on state
         if i == active_corner:
             # Active/dragging - white
             color = active_color
@@ -232,38 +227,10 @@ def _draw_crop_handles(screen_corners, screen_midpoints, active_corner, hover_co
             # Normal - white but dimmer
             color = handle_color
         
-        # Create handle vertices - using matrix-based rotation (like gizmos)
-        if abs(angle) > 0.01:  # If strip is rotated
-            # Use direct angle calculation like gizmo version
-            cos_a = math.cos(angle)
-            sin_a = math.sin(angle)
-            
-            # Define square corners relative to center
-            corners_rel = [
-                (-size, -size), (size, -size), (size, size), (-size, size)
-            ]
-            
-            # Rotate and translate
-            vertices = []
-            for x_rel, y_rel in corners_rel:
-                x = x_rel * cos_a - y_rel * sin_a + pos[0]
-                y = x_rel * sin_a + y_rel * cos_a + pos[1]
-                vertices.append((x, y))
-            
-            # Reorder vertices like gizmo version for proper triangle winding
-            vertices = [vertices[0], vertices[1], vertices[3], vertices[2]]
-        else:
-            # No rotation - draw regular square handle
-            vertices = [
-                (pos[0] - size, pos[1] - size),
-                (pos[0] + size, pos[1] - size),
-                (pos[0] - size, pos[1] + size),
-                (pos[0] + size, pos[1] + size)
-            ]
-        
-        indices = ((0, 1, 2), (2, 1, 3))
+        handle_matrix.translation = (pos[0], pos[1], 0.0)
         
-        batch = batch_for_shader(shader, 'TRIS', {"pos": vertices}, indices=indices)
-        shader.bind()
         shader.uniform_float("color", color)
-        batch.draw(shader)
\ No newline at end of file
+        gpu.matrix.push()
+        gpu.matrix.multiply_matrix(handle_matrix)
+        batch.draw(shader)
+        gpu.matrix.pop()
@@ -12,7 +12,10 @@ from mathutils import Vector
 from .crop_core import (
     get_crop_state, set_crop_active, get_draw_data, set_draw_data,
     get_draw_handle, set_draw_handle, clear_crop_state,
-    get_strip_geometry_with_flip_support, is_strip_visible_at_frame, point_in_polygon
+    get_strip_geometry_with_flip_support, is_strip_visible_at_frame, point_in_polygon,
+    track_gizmo_disabled_space, untrack_gizmo_disabled_space, get_strip_accessors,
+    get_strip_size, apply_crop_sides, CORNER_CROP_SIDES, EDGE_CROP_SIDES,
+    CORNER_FLIP_REMAP, EDGE_FLIP_REMAP, resolution_points_to_region
 )
 from .crop_drawing import draw_crop_handles
 
@@ -110,11 +113,15 @@ class EASYCROP_OT_crop(bpy.types.Operator):
         self.crop_start = (0.0, 0.0, 0.0, 0.0)
         self.timer = None
         
+        # Sequencer areas to redraw during the modal - found once instead of per event
+        self._sequencer_areas = [area for area in context.screen.areas if area.type == 'SEQUENCE_EDITOR']
+        
         # Store the current transform overlay state
         self.prev_show_gizmo = None
         if hasattr(context.space_data, 'show_gizmo'):
             self.prev_show_gizmo = context.space_data.show_gizmo
             context.space_data.show_gizmo = False
+            track_gizmo_disabled_space(context.space_data)
         
         # Clean up any existing handler
         if get_draw_handle() is not None:
@@ -165,9 +172,7 @@ class EASYCROP_OT_crop(bpy.types.Operator):
         
         # Handle timer events
         if event.type == 'TIMER':
-            for area in context.screen.areas:
-                if area.type == 'SEQUENCE_EDITOR':
-                    area.tag_redraw()
+            self._tag_sequencer_redraw()
             return {'RUNNING_MODAL'}
         
         strip = context.scene.sequence_editor.active_strip
@@ -191,6 +196,9 @@ class EASYCROP_OT_crop(bpy.types.Operator):
                         self.crop_start = (crop_data.min_x, crop_data.max_x, crop_data.min_y, crop_data.max_y)
                     else:
                         self.crop_start = (0, 0, 0, 0)
+                
+                # Rotation, flip, scale and size stay fixed for the whole drag
+                self._store_drag_transform(strip, context.scene)
             else:
                 # Check if clicking on another strip
                 mouse_pos = Vector((event.mouse_region_x, event.mouse_region_y))
@@ -226,9 +234,7 @@ class EASYCROP_OT_crop(bpy.types.Operator):
         
         elif event.type == 'MOUSEMOVE' and self.active_corner >= 0:
             self._update_crop(context, event)
-            for area in context.screen.areas:
-                if area.type == 'SEQUENCE_EDITOR':
-                    area.tag_redraw()
+            self._tag_sequencer_redraw()
             return {'RUNNING_MODAL'}
         
         elif event.type in {'RET', 'NUMPAD_ENTER'}:
@@ -257,9 +263,7 @@ class EASYCROP_OT_crop(bpy.types.Operator):
                     # Update the stored start values so ESC won't restore the old crop
                     self.crop_start = (0, 0, 0, 0)
                     # Force redraw to show the change immediately
-                    for area in context.screen.areas:
-                        if area.type == 'SEQUENCE_EDITOR':
-                            area.tag_redraw()
+                    self._tag_sequencer_redraw()
             return {'RUNNING_MODAL'}
         
         elif self._is_transform_key(context, event):
@@ -290,6 +294,7 @@ class EASYCROP_OT_crop(bpy.types.Operator):
         # Restore transform gizmo visibility
         if hasattr(self, 'prev_show_gizmo') and self.prev_show_gizmo is not None and hasattr(context.space_data, 'show_gizmo'):
             context.space_data.show_gizmo = self.prev_show_gizmo
+            untrack_gizmo_disabled_space(context.space_data)
         
         # Remove timer
         if hasattr(self, 'timer') and self.timer:
@@ -322,21 +327,27 @@ class EASYCROP_OT_crop(bpy.types.Operator):
         
         return {'CANCELLED'} if cancelled else {'FINISHED'}
     
+    def _tag_sequencer_redraw(self):
+        """Redraw the sequencer areas found when crop mode started"""
+        for area in self._sequencer_areas:
+            try:
+                area.tag_redraw()
+            except ReferenceError:
+                pass  # Area was closed during the modal
+    
     def _get_corner_at_mouse(self, context, event):
         """Check if mouse is over a corner or edge handle"""
-        mouse_pos = Vector((event.mouse_region_x, event.mouse_region_y))
+        mouse_x = event.mouse_region_x
+        mouse_y = event.mouse_region_y
         corners, midpoints = self._get_crop_corners(context)
         
-        # Check corner handles first (0-3)
-        for i, corner in enumerate(corners):
-            if (corner - mouse_pos).length < 10:
+        # Corner handles first (0-3), then edge handles (4-7) - squared 10px radius
+        for i, (x, y) in enumerate(corners + midpoints):
+            dx = x - mouse_x
+            dy = y - mouse_y
+            if dx * dx + dy * dy < 100:
                 return i
         
-        # Check edge handles (4-7)
-        for i, midpoint in enumerate(midpoints):
-            if (midpoint - mouse_pos).length < 10:
-                return i + 4
-        
         return -1
     
     def _get_crop_corners(self, context):
@@ -348,31 +359,18 @@ class EASYCROP_OT_crop(bpy.types.Operator):
         
         corners, (pivot_x, pivot_y), (scale_x, scale_y, flip_x, flip_y) = get_strip_geometry_with_flip_support(strip, scene)
         
-        # Calculate edge midpoints
-        edge_midpoints = []
-        for i in range(4):
-            next_i = (i + 1) % 4
-            midpoint = (corners[i] + corners[next_i]) / 2
-            edge_midpoints.append(midpoint)
+        # Handle points: 4 corners, then 4 edge midpoints
+        points = [(corner.x, corner.y) for corner in corners]
+        points += [((x1 + x2) * 0.5, (y1 + y2) * 0.5)
+                   for (x1, y1), (x2, y2) in zip(points, points[1:] + points[:1])]
         
         # Transform to screen coordinates
-        view2d = context.region.view2d
-        res_x = scene.render.resolution_x
-        res_y = scene.render.resolution_y
-        
-        screen_corners = []
-        for corner in corners:
-            view_x = corner.x - res_x / 2
-            view_y = corner.y - res_y / 2
-            screen_co = view2d.view_to_region(view_x, view_y, clip=False)
-            screen_corners.append(Vector(screen_co))
-        
-        screen_midpoints = []
-        for midpoint in edge_midpoints:
-            view_x = midpoint.x - res_x / 2
-            view_y = midpoint.y - res_y / 2
-            screen_co = view2d.view_to_region(view_x, view_y, clip=False)
-            screen_midpoints.append(Vector(screen_co))
+        screen_points = resolution_points_to_region(
+            context.region.view2d, points, scene.render.resolution_x, scene.render.resolution_y)
+        if not screen_points:
+            return [], []
+        screen_corners = screen_points[:4]
+        screen_midpoints = screen_points[4:]
         
         return screen_corners, screen_midpoints
     
@@ -383,7 +381,6 @@ class EASYCROP_OT_crop(bpy.types.Operator):
     def _update_crop(self, context, event):
         """Update crop values based on mouse drag with flip support"""
         strip = context.scene.sequence_editor.active_strip
-        scene = context.scene
         
         if not strip or not hasattr(strip, 'crop') or not strip.crop:
             return
@@ -403,154 +400,66 @@ class EASYCROP_OT_crop(bpy.types.Operator):
         dx_view = dx * scale_x
         dy_view = dy * scale_y
         
-        # Get strip properties
-        strip_scale_x = strip.transform.scale_x if hasattr(strip, 'transform') and hasattr(strip.transform, 'scale_x') else 1.0
-        strip_scale_y = strip.transform.scale_y if hasattr(strip, 'transform') and hasattr(strip.transform, 'scale_y') else 1.0
-        
-        # Check for flip states
-        flip_x = False
-        flip_y = False
-        
-        for attr_name in ['use_flip_x', 'flip_x', 'mirror_x']:
-            if hasattr(strip, attr_name):
-                flip_x = getattr(strip, attr_name)
-                break
-        
-        for attr_name in ['use_flip_y', 'flip_y', 'mirror_y']:
-            if hasattr(strip, attr_name):
-                flip_y = getattr(strip, attr_name)
-                break
-        
-        # Handle rotation
-        angle = 0
-        if hasattr(strip, 'rotation_start'):
-            angle = -math.radians(strip.rotation_start)
-        elif hasattr(strip, 'transform') and hasattr(strip.transform, 'rotation'):
-            angle = -strip.transform.rotation
-        
-        # Adjust rotation for flip
-        if flip_x != flip_y:
-            angle = -angle
-        
-        # Apply rotation to delta
-        if angle != 0:
-            cos_a = math.cos(angle)
-            sin_a = math.sin(angle)
+        # Apply rotation to delta - cos/sin were resolved when the drag started
+        if self._drag_rotated:
+            cos_a = self._drag_cos
+            sin_a = self._drag_sin
             rotated_dx = dx_view * cos_a - dy_view * sin_a
             rotated_dy = dx_view * sin_a + dy_view * cos_a
             dx_view = rotated_dx
             dy_view = rotated_dy
         
         # Convert to strip's original image space
-        dx_res = dx_view / strip_scale_x
-        dy_res = dy_view / strip_scale_y
+        dx_res = dx_view / self._drag_scale_x
+        dy_res = dy_view / self._drag_scale_y
         
         # Invert deltas for flipped strips
+        flip_x = self._drag_flip_x
+        flip_y = self._drag_flip_y
         if flip_x:
             dx_res = -dx_res
         if flip_y:
             dy_res = -dy_res
         
-        # Get strip dimensions
-        strip_width = scene.render.resolution_x
-        strip_height = scene.render.resolution_y
-        
-        if hasattr(strip, 'elements') and strip.elements and len(strip.elements) > 0:
-            elem = strip.elements[0]
-            if hasattr(elem, 'orig_width') and hasattr(elem, 'orig_height'):
-                strip_width = elem.orig_width
-                strip_height = elem.orig_height
+        strip_width, strip_height = self._drag_strip_size
         
         # Apply crop changes
-        self._apply_crop_changes(strip, dx_res, dy_res, strip_width, strip_height, flip_x, flip_y)
+        self._apply_crop_changes(strip, dx_res, dy_res, strip_width, strip_height)
     
-    def _apply_crop_changes(self, strip, dx_res, dy_res, strip_width, strip_height, flip_x, flip_y):
-        """Apply crop changes based on the active corner and flip state"""
+    def _store_drag_transform(self, strip, scene):
+        """Resolve the strip properties used by every drag update"""
+        # Get strip properties
+        transform = getattr(strip, 'transform', None)
+        self._drag_scale_x = getattr(transform, 'scale_x', 1.0)
+        self._drag_scale_y = getattr(transform, 'scale_y', 1.0)
+        
+        # Check for flip states and rotation
+        get_rotation, get_flip_x, get_flip_y = get_strip_accessors(strip)
+        self._drag_flip_x = flip_x = get_flip_x(strip)
+        self._drag_flip_y = flip_y = get_flip_y(strip)
+        angle = -get_rotation(strip)
+        
+        # Adjust rotation for flip
+        if flip_x != flip_y:
+            angle = -angle
+        
+        # Crop sides moved by the active handle, remapped for flipped strips
+        flips = (bool(flip_x), bool(flip_y))
         if self.active_corner < 4:
-            # Corner handles - remap based on flips
-            corner_map = self.active_corner
-            
-            if flip_x and flip_y:
-                corner_remap = {0: 2, 1: 3, 2: 0, 3: 1}
-                corner_map = corner_remap[self.active_corner]
-            elif flip_x:
-                corner_remap = {0: 3, 1: 2, 2: 1, 3: 0}
-                corner_map = corner_remap[self.active_corner]
-            elif flip_y:
-                corner_remap = {0: 1, 1: 0, 2: 3, 3: 2}
-                corner_map = corner_remap[self.active_corner]
-            
-            # Apply crop changes based on remapped corner
-            if corner_map == 0:  # Bottom-left
-                new_min_x = int(max(0, self.crop_start[0] + dx_res))
-                if new_min_x + strip.crop.max_x < strip_width:
-                    strip.crop.min_x = new_min_x
-                
-                new_min_y = int(max(0, self.crop_start[2] + dy_res))
-                if new_min_y + strip.crop.max_y < strip_height:
-                    strip.crop.min_y = new_min_y
-                        
-            elif corner_map == 1:  # Top-left
-                new_min_x = int(max(0, self.crop_start[0] + dx_res))
-                if new_min_x + strip.crop.max_x < strip_width:
-                    strip.crop.min_x = new_min_x
-                
-                new_max_y = int(max(0, self.crop_start[3] - dy_res))
-                if strip.crop.min_y + new_max_y < strip_height:
-                    strip.crop.max_y = new_max_y
-                        
-            elif corner_map == 2:  # Top-right
-                new_max_x = int(max(0, self.crop_start[1] - dx_res))
-                if strip.crop.min_x + new_max_x < strip_width:
-                    strip.crop.max_x = new_max_x
-                
-                new_max_y = int(max(0, self.crop_start[3] - dy_res))
-                if strip.crop.min_y + new_max_y < strip_height:
-                    strip.crop.max_y = new_max_y
-                        
-            elif corner_map == 3:  # Bottom-right
-                new_max_x = int(max(0, self.crop_start[1] - dx_res))
-                if strip.crop.min_x + new_max_x < strip_width:
-                    strip.crop.max_x = new_max_x
-                
-                new_min_y = int(max(0, self.crop_start[2] + dy_res))
-                if new_min_y + strip.crop.max_y < strip_height:
-                    strip.crop.min_y = new_min_y
+            self._drag_crop_sides = CORNER_CROP_SIDES[CORNER_FLIP_REMAP[flips][self.active_corner]]
         else:
-            # Edge handles - remap based on flips
-            edge_index = self.active_corner - 4
-            edge_map = edge_index
-            
-            if flip_x and flip_y:
-                edge_remap = {0: 2, 1: 3, 2: 0, 3: 1}
-                edge_map = edge_remap[edge_index]
-            elif flip_x:
-                edge_remap = {0: 2, 1: 1, 2: 0, 3: 3}
-                edge_map = edge_remap[edge_index]
-            elif flip_y:
-                edge_remap = {0: 0, 1: 3, 2: 2, 3: 1}
-                edge_map = edge_remap[edge_index]
-            
-            # Apply crop changes based on remapped edge
-            if edge_map == 0:  # Left edge
-                new_min_x = int(max(0, self.crop_start[0] + dx_res))
-                if new_min_x + strip.crop.max_x < strip_width:
-                    strip.crop.min_x = new_min_x
-                        
-            elif edge_map == 1:  # Top edge
-                new_max_y = int(max(0, self.crop_start[3] - dy_res))
-                if strip.crop.min_y + new_max_y < strip_height:
-                    strip.crop.max_y = new_max_y
-                        
-            elif edge_map == 2:  # Right edge
-                new_max_x = int(max(0, self.crop_start[1] - dx_res))
-                if strip.crop.min_x + new_max_x < strip_width:
-                    strip.crop.max_x = new_max_x
-                        
-            elif edge_map == 3:  # Bottom edge
-                new_min_y = int(max(0, self.crop_start[2] + dy_res))
-                if new_min_y + strip.crop.max_y < strip_height:
-                    strip.crop.min_y = new_min_y
+            self._drag_crop_sides = EDGE_CROP_SIDES[EDGE_FLIP_REMAP[flips][self.active_corner - 4]]
+        
+        self._drag_rotated = angle != 0
+        self._drag_cos = math.cos(angle)
+        self._drag_sin = math.sin(angle)
+        
+        # Get strip dimensions
+        self._drag_strip_size = get_strip_size(strip, scene)
+    
+    def _apply_crop_changes(self, strip, dx_res, dy_res, strip_width, strip_height):
+        """Apply crop changes to the sides moved by the active handle"""
+        apply_crop_sides(strip.crop, self._drag_crop_sides, self.crop_start, dx_res, dy_res, strip_width, strip_height)
     
     def _is_transform_key(self, context, event):
         """Check if the pressed key is bound to a transform operator"""